@@ -36,6 +36,9 @@ APP_SETTINGS = {
     "touch_target_min": 44,
     "focus_outline_width": 3,
     "database_path": "data/inclusive_design.db",
+    # Prompt budget for the consultation overview
+    "overview_max_messages_per_session": 20,
+    "overview_max_chars": 60000,
 }
 
 PHASES = {
@@ -57,6 +57,12 @@ class AIManager:
             "content": content
         })
 
+    def extend_history(self, messages: list[tuple[str, str]]):
+        """Add several (role, content) messages to conversation history."""
+        self.conversation_history.extend(
+            [{"role": role, "content": content} for role, content in messages]
+        )
+
     async def test_connection(self) -> tuple[bool, str]:
         """Test connection to the AI provider."""
         try:
@@ -10,6 +10,9 @@ from config.settings import PHASES, PHASE_ORDER
 from prompts.system_prompts import get_phase_reasoning, CONSULTATION_TYPES
 from .database import DatabaseManager, Session
 
+# Marks a phase lookup that has not been computed since the last move
+_UNSET = object()
+
 
 class ConversationManager:
     """Manage consultation conversations and progress."""
@@ -22,6 +25,13 @@ class ConversationManager:
         self.is_temporary = False
         self._temp_user_id = None
         self._temp_conversation = []
+        self._invalidate_phase_cache()
+
+    def _invalidate_phase_cache(self):
+        """Forget the cached phase, reasoning and question lookups."""
+        self._cached_phase = None
+        self._cached_reasoning = None
+        self._cached_question = _UNSET
 
     def start_new_session(self, user_id: int, title: str, template_type: str) -> Session:
         """Start a new consultation session."""
@@ -30,6 +40,7 @@ class ConversationManager:
         self.current_phase_index = 0
         self.current_question_index = 0
         self.is_temporary = False
+        self._invalidate_phase_cache()
         return session
 
     def start_temporary_session(self, user_id: int, title: str, template_type: str):
@@ -47,6 +58,7 @@ class ConversationManager:
         self.is_temporary = True
         self._temp_user_id = user_id
         self._temp_conversation = []
+        self._invalidate_phase_cache()
 
     def save_temporary_session(self) -> Optional[Session]:
         """Save a temporary session to the database."""
@@ -89,38 +101,54 @@ class ConversationManager:
             self.current_question_index = session.current_question_index
             self.is_temporary = False
             self._temp_conversation = []
+            self._invalidate_phase_cache()
         return session
 
     def get_current_phase(self) -> dict:
         """Get current phase information."""
+        if self._cached_phase is not None:
+            return self._cached_phase
+
         if self.current_phase_index >= len(PHASE_ORDER):
-            return {
+            self._cached_phase = {
                 "key": "complete",
                 "name": "Consultation Complete",
                 "questions": []
             }
+            return self._cached_phase
 
         phase_key = PHASE_ORDER[self.current_phase_index]
         phase_data = PHASES[phase_key]
-        return {
+        self._cached_phase = {
             "key": phase_key,
             "name": phase_data["name"],
             "questions": phase_data["questions"]
         }
+        return self._cached_phase
 
     def get_current_question(self) -> Optional[str]:
         """Get the current question to ask."""
+        if self._cached_question is not _UNSET:
+            return self._cached_question
+
         phase = self.get_current_phase()
         if self.current_question_index < len(phase["questions"]):
-            return phase["questions"][self.current_question_index]
-        return None
+            self._cached_question = phase["questions"][self.current_question_index]
+        else:
+            self._cached_question = None
+        return self._cached_question
 
     def get_phase_reasoning(self) -> dict:
         """Get reasoning for current phase."""
+        if self._cached_reasoning is not None:
+            return self._cached_reasoning
+
         if self.current_phase_index >= len(PHASE_ORDER):
-            return {}
-        phase_key = PHASE_ORDER[self.current_phase_index]
-        return get_phase_reasoning(phase_key, self.current_question_index)
+            self._cached_reasoning = {}
+        else:
+            phase_key = PHASE_ORDER[self.current_phase_index]
+            self._cached_reasoning = get_phase_reasoning(phase_key, self.current_question_index)
+        return self._cached_reasoning
 
     def advance_question(self) -> bool:
         """Move to next question. Returns True if moved to new phase."""
@@ -129,6 +157,7 @@ class ConversationManager:
 
         phase = self.get_current_phase()
         self.current_question_index += 1
+        self._invalidate_phase_cache()
 
         new_phase = False
         if self.current_question_index >= len(phase["questions"]):
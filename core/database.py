@@ -4,12 +4,37 @@ import json
 import os
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, ForeignKey
+from typing import NamedTuple
+from sqlalchemy import create_engine, event, Column, Integer, String, DateTime, Boolean, Text, ForeignKey
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 
 Base = declarative_base()
 
+NOTE_TIMESTAMP_FORMAT = "%b %d, %Y at %I:%M %p"
+
+
+@lru_cache(maxsize=2048)
+def _format_note_timestamp(iso_timestamp: str) -> str:
+    """Format a stored ISO timestamp for display (memoized; notes never change their time)."""
+    return datetime.fromisoformat(iso_timestamp).strftime(NOTE_TIMESTAMP_FORMAT)
+
+
+def _with_display_timestamps(notes: list) -> list:
+    """Attach a formatted 'timestamp_display' to each note, once per load."""
+    for note in notes:
+        note["timestamp_display"] = _format_note_timestamp(note["timestamp"])
+    return notes
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so thread-pool readers don't wait on the UI's writes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 def get_data_directory() -> Path:
     """Get the appropriate data directory for the application."""
@@ -147,6 +172,38 @@ class ConsultOverview(Base):
         self.notes = notes_list
 
 
+class SessionDisplayRow(NamedTuple):
+    """The session columns shown on a dashboard card."""
+    id: int
+    title: str
+    template_type: str
+    completed: bool
+    current_phase: str
+    updated_at: datetime
+
+
+class OverviewDisplayRow(NamedTuple):
+    """The overview columns shown on a dashboard card."""
+    id: int
+    title: str
+    sessions_analyzed: int
+    created_at: datetime
+
+
+class SessionConversationRow(NamedTuple):
+    """The session columns an overview is built from."""
+    id: int
+    title: str
+    template_type: str
+    created_at: datetime
+    updated_at: datetime
+    conversation_json: str
+
+    @property
+    def conversation(self) -> list:
+        return json.loads(self.conversation_json or "[]")
+
+
 class DatabaseManager:
     """Database connection and session management."""
 
@@ -159,7 +216,14 @@ class DatabaseManager:
             self.db_path = Path(db_path)
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        # Pooled connections are shared by the UI thread and thread-pool tasks;
+        # each keeps a larger sqlite3 statement cache than the default 128
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            connect_args={"cached_statements": 256, "check_same_thread": False},
+        )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
 
         # Run migrations for new columns
@@ -280,6 +344,43 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def get_user_session_display_rows(self, user_id: int, limit: int = 12) -> list[SessionDisplayRow]:
+        """Get the most recent sessions for a user as lightweight card rows."""
+        session = self.get_session()
+        try:
+            rows = session.query(
+                Session.id, Session.title, Session.template_type,
+                Session.completed, Session.current_phase, Session.updated_at
+            ).filter(
+                Session.user_id == user_id
+            ).order_by(Session.updated_at.desc()).limit(limit).all()
+            return [SessionDisplayRow(*row) for row in rows]
+        finally:
+            session.close()
+
+    def get_user_session_versions(self, user_id: int) -> list[tuple[int, datetime]]:
+        """Get (id, updated_at) for every session of a user, to tell whether any changed."""
+        session = self.get_session()
+        try:
+            rows = session.query(Session.id, Session.updated_at).filter(Session.user_id == user_id).all()
+            return [tuple(row) for row in rows]
+        finally:
+            session.close()
+
+    def get_user_sessions_with_conversations(self, user_id: int) -> list[SessionConversationRow]:
+        """Get every session of a user with its conversation, in one query."""
+        session = self.get_session()
+        try:
+            rows = session.query(
+                Session.id, Session.title, Session.template_type,
+                Session.created_at, Session.updated_at, Session.conversation_json
+            ).filter(
+                Session.user_id == user_id
+            ).order_by(Session.updated_at.desc()).all()
+            return [SessionConversationRow(*row) for row in rows]
+        finally:
+            session.close()
+
     def get_session_by_id(self, session_id: int) -> Session:
         """Get session by ID."""
         session = self.get_session()
@@ -301,14 +402,16 @@ class DatabaseManager:
         finally:
             db_session.close()
 
-    def delete_session(self, session_id: int):
-        """Delete a session."""
+    def delete_session(self, session_id: int) -> bool:
+        """Delete a session; return whether it existed."""
         session = self.get_session()
         try:
             sess = session.query(Session).filter(Session.id == session_id).first()
             if sess:
                 session.delete(sess)
                 session.commit()
+                return True
+            return False
         finally:
             session.close()
 
@@ -323,12 +426,42 @@ class DatabaseManager:
         finally:
             db_session.close()
 
+    def add_session_notes_bulk(self, notes: list) -> dict:
+        """Add (session_id, content, iso_timestamp) notes in one transaction; return the stored notes by session_id."""
+        by_session = {}
+        for session_id, content, timestamp in notes:
+            by_session.setdefault(session_id, []).append({"content": content, "timestamp": timestamp})
+
+        db_session = self.get_session()
+        try:
+            added = {}
+            for sess in db_session.query(Session).filter(Session.id.in_(by_session)).all():
+                new_notes = by_session[sess.id]
+                sess.notes = sess.notes + new_notes
+                added[sess.id] = _with_display_timestamps(new_notes)
+            db_session.commit()
+            return added
+        finally:
+            db_session.close()
+
     def get_session_notes(self, session_id: int) -> list:
         """Get all notes for a session."""
         db_session = self.get_session()
         try:
             sess = db_session.query(Session).filter(Session.id == session_id).first()
-            return sess.notes if sess else []
+            return _with_display_timestamps(sess.notes) if sess else []
+        finally:
+            db_session.close()
+
+    def get_notes_for_sessions(self, session_ids: list) -> dict:
+        """Get the notes of several sessions in one query, keyed by session_id."""
+        db_session = self.get_session()
+        try:
+            rows = db_session.query(Session.id, Session.notes_json).filter(Session.id.in_(session_ids)).all()
+            return {
+                session_id: _with_display_timestamps(json.loads(notes_json or "[]"))
+                for session_id, notes_json in rows
+            }
         finally:
             db_session.close()
 
@@ -373,6 +506,20 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def get_user_overview_display_rows(self, user_id: int, limit: int = 9) -> list[OverviewDisplayRow]:
+        """Get the most recent overviews for a user as lightweight card rows, without their content."""
+        session = self.get_session()
+        try:
+            rows = session.query(
+                ConsultOverview.id, ConsultOverview.title,
+                ConsultOverview.sessions_analyzed, ConsultOverview.created_at
+            ).filter(
+                ConsultOverview.user_id == user_id
+            ).order_by(ConsultOverview.created_at.desc()).limit(limit).all()
+            return [OverviewDisplayRow(*row) for row in rows]
+        finally:
+            session.close()
+
     def get_overview_by_id(self, overview_id: int) -> ConsultOverview:
         """Get overview by ID."""
         session = self.get_session()
@@ -381,14 +528,16 @@ class DatabaseManager:
         finally:
             session.close()
 
-    def delete_overview(self, overview_id: int):
-        """Delete an overview."""
+    def delete_overview(self, overview_id: int) -> bool:
+        """Delete an overview; return whether it existed."""
         session = self.get_session()
         try:
             overview = session.query(ConsultOverview).filter(ConsultOverview.id == overview_id).first()
             if overview:
                 session.delete(overview)
                 session.commit()
+                return True
+            return False
         finally:
             session.close()
 
@@ -408,7 +557,7 @@ class DatabaseManager:
         db_session = self.get_session()
         try:
             overview = db_session.query(ConsultOverview).filter(ConsultOverview.id == overview_id).first()
-            return overview.notes if overview else []
+            return _with_display_timestamps(overview.notes) if overview else []
         finally:
             db_session.close()
 
@@ -73,6 +73,11 @@ Examine each principle with its success criteria, focusing on Level AA complianc
     }
 }
 
+# First sentence of each prompt, shown when the type is picked in a dialog
+for _type in CONSULTATION_TYPES.values():
+    _type["short_description"] = _type["prompt"].split(".", 1)[0] + "." if _type.get("prompt") else ""
+del _type
+
 def get_phase_reasoning(phase_key: str, question_index: int) -> dict:
     """Get reasoning context for a specific question."""
 
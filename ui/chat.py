@@ -1,18 +1,35 @@
 """Chat interface for consultations."""
 
 import asyncio
+import queue
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QTextEdit, QSplitter, QProgressBar,
-    QDialog, QFileDialog, QMessageBox
+    QDialog, QFileDialog, QMessageBox, QProgressDialog, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSlot
+)
+from PyQt6.QtGui import QTextCursor, QTextDocument, QTextDocumentFragment
+from sqlalchemy.exc import SQLAlchemyError
 
-from config.settings import COLORS, PHASES, PHASE_ORDER
+from config.settings import COLORS, PHASES, PHASE_ORDER, get_colors
 from prompts.system_prompts import get_phase_reasoning
 from core.ai_manager import AIManager
 from core.conversation import ConversationManager
+from ui.styles import shared_font
+
+RESOURCES = [
+    ("UDL Guidelines", "https://udlguidelines.cast.org"),
+    ("WCAG 2.1", "https://www.w3.org/WAI/WCAG21/quickref/"),
+    ("A11Y Project", "https://www.a11yproject.com"),
+]
+
+# Sidebar link markup, built once; {primary} is filled with the link color
+RESOURCE_LINKS_HTML = [
+    f'<a href="{url}" style="color: {{primary}};">{name}</a>'
+    for name, url in RESOURCES
+]
 
 
 class ChatTutorialDialog(QDialog):
@@ -116,13 +133,13 @@ class ChatTutorialDialog(QDialog):
 
         # Title
         self.title_label = QLabel()
-        self.title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        self.title_label.setFont(shared_font(20, bold=True))
         self.title_label.setWordWrap(True)
         layout.addWidget(self.title_label)
 
         # Content
         self.content_label = QLabel()
-        self.content_label.setFont(QFont("Arial", 14))
+        self.content_label.setFont(shared_font(14))
         self.content_label.setWordWrap(True)
         self.content_label.setStyleSheet(f"color: {COLORS['text']}; line-height: 1.5;")
         self.content_label.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -187,62 +204,153 @@ class ChatTutorialDialog(QDialog):
 
 
 class AIWorker(QThread):
-    """Worker thread for AI responses."""
+    """Long-lived worker thread that serves AI requests from a queue.
+
+    One thread and one asyncio event loop are kept for the lifetime of the
+    chat, so each turn only pays for the request itself.
+    """
 
     chunk_received = pyqtSignal(str)
-    finished = pyqtSignal()
+    # Per-response completion; QThread.finished still reports thread exit
+    response_finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, ai_manager: AIManager, message: str, phase_context: dict = None):
+    def __init__(self, ai_manager: AIManager):
         super().__init__()
         self.ai_manager = ai_manager
-        self.message = message
-        self.phase_context = phase_context
-        self._had_error = False
+        self.busy = False
+        self._jobs = queue.Queue()
+        self._loop = None
+        self._task = None
+        # Set by stop(); _run_job checks it once its task exists
+        self._stop_requested = False
+
+    def start(self, *args):
+        """Start the thread with any earlier stop request cleared."""
+        self._stop_requested = False
+        super().start(*args)
+
+    def submit(self, message: str, phase_context: dict = None):
+        """Queue a message for generation."""
+        self.busy = True
+        self._jobs.put((message, phase_context))
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Cancel any running generation and wait for the thread to exit."""
+        if not self.isRunning():
+            return
+        self._stop_requested = True
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
+        self._jobs.put(None)
+        self.wait()
 
     def run(self):
-        """Run the AI generation."""
-        loop = None
+        """Process queued requests until stopped."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            async def generate():
-                try:
-                    async for chunk in self.ai_manager.generate_response(
-                        self.message, self.phase_context
-                    ):
-                        self.chunk_received.emit(chunk)
-                except Exception as e:
-                    self._had_error = True
-                    self.error.emit(f"AI generation error: {str(e)}")
-
-            loop.run_until_complete(generate())
-
-            # Only emit finished if no error occurred
-            if not self._had_error:
-                self.finished.emit()
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                self._run_job(*job)
+        finally:
+            try:
+                # Close any generator left open by a cancelled request so its
+                # HTTP session is released now rather than at garbage collection
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.close()
+            except Exception:
+                pass
+            self._loop = None
+
+    def _run_job(self, message: str, phase_context: dict):
+        """Run a single AI generation on the worker's event loop."""
+        had_error = False
+
+        async def generate():
+            nonlocal had_error
+            try:
+                async for chunk in self.ai_manager.generate_response(
+                    message, phase_context
+                ):
+                    self.chunk_received.emit(chunk)
+            except Exception as e:
+                had_error = True
+                self.error.emit(f"AI generation error: {str(e)}")
 
+        try:
+            self._task = self._loop.create_task(generate())
+            # stop() may have run between taking the job and creating the
+            # task, when there was nothing to cancel
+            if self._stop_requested:
+                self._task.cancel()
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            return
         except Exception as e:
+            had_error = True
             self.error.emit(f"Worker error: {str(e)}")
         finally:
-            if loop:
-                try:
-                    loop.close()
-                except Exception:
-                    pass
+            self._task = None
+            self.busy = False
+
+        # Only emit response_finished if no error occurred
+        if not had_error:
+            self.response_finished.emit()
+
+
+class ExportSignals(QObject):
+    """Signals emitted by ExportWorker."""
+
+    done = pyqtSignal(bool, str)  # success, filepath
+
+
+class ExportWorker(QRunnable):
+    """Thread-pool task that writes a consultation to DOCX."""
+
+    def __init__(self, conversation: ConversationManager, filepath: str):
+        super().__init__()
+        self.conversation = conversation
+        self.filepath = filepath
+        self.signals = ExportSignals()
+
+    def run(self):
+        """Run the export."""
+        success = self.conversation.export_to_docx(self.filepath)
+        self.signals.done.emit(success, self.filepath)
 
 
 class MessageBubble(QFrame):
     """Chat message bubble widget."""
 
-    def __init__(self, role: str, content: str, reasoning: dict = None):
+    # Characters shown by a lazy bubble before it is fully rendered
+    PLACEHOLDER_CHARS = 200
+
+    def __init__(self, role: str, content: str, reasoning: dict = None,
+                 streaming: bool = False, lazy: bool = False):
         super().__init__()
         self.role = role
         self.reasoning = reasoning or {}
-        self.setup_ui(content)
+        self.content = content
+        self.stream_view = None
+        self.is_rendered = False
+        self._last_style_key = None
+        self.setup_ui(content, streaming)
+        if not streaming:
+            if lazy:
+                self.render_placeholder()
+            else:
+                self.render_full()
 
-    def setup_ui(self, content: str):
+    def setup_ui(self, content: str, streaming: bool = False):
         """Set up the message bubble UI."""
         is_user = self.role == "user"
         border_color = COLORS['tertiary'] if is_user else COLORS.get('dark_border', '#1c2a4a')
@@ -261,42 +369,145 @@ class MessageBubble(QFrame):
         layout.setSpacing(8)
 
         # Role label
-        role_text = "You" if is_user else "AI Consultant"
-        role_label = QLabel(role_text)
-        role_label.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {COLORS['text_muted']};")
-        layout.addWidget(role_label)
+        self.role_text = "You" if is_user else "AI Consultant"
+        self.role_label = QLabel(self.role_text)
+        self.role_label.setStyleSheet(f"font-weight: bold; font-size: 12px; color: {COLORS['text_muted']};")
+        layout.addWidget(self.role_label)
 
         # Content
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        content_label.setStyleSheet("font-size: 16px;")
-        layout.addWidget(content_label)
+        self.content_label = QLabel()
+        self.content_label.setWordWrap(True)
+        self.content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.content_label.setStyleSheet("font-size: 16px;")
+        layout.addWidget(self.content_label)
+
+        if streaming:
+            # Streamed replies get their own document. Finished paragraphs
+            # are rendered once and kept; only the trailing paragraph is
+            # re-rendered as chunks arrive, and the whole reply gets one
+            # final markdown pass when the stream ends.
+            self.content_label.hide()
+            self._doc = QTextDocument(self)
+            self._stable_len = 0
+            self._tail_pos = 0
+            self.stream_view = QTextEdit()
+            self.stream_view.setDocument(self._doc)
+            self.stream_view.setReadOnly(True)
+            self.stream_view.setFrameShape(QFrame.Shape.NoFrame)
+            self.stream_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            self.stream_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            self.stream_view.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+            self.stream_view.setStyleSheet("font-size: 16px;")
+            self.stream_view.setPlaceholderText(content)
+            self._doc.documentLayout().documentSizeChanged.connect(self._fit_stream_view)
+            layout.addWidget(self.stream_view)
+            self._fit_stream_view()
 
         # Accessibility
-        self.setAccessibleName(f"{role_text} says: {content[:100]}...")
+        self.setAccessibleName(f"{self.role_text} says: {content[:100]}...")
+
+    def _fit_stream_view(self, *_):
+        """Grow the streaming view to fit its document instead of scrolling."""
+        view = self.stream_view
+        if view is None:
+            return
+        margins = view.contentsMargins()
+        height = self._doc.size().height() + margins.top() + margins.bottom()
+        view.setFixedHeight(max(int(height), view.fontMetrics().lineSpacing()))
+
+    def stream_markdown(self, content: str):
+        """Render streamed markdown, re-parsing only the unfinished paragraph."""
+        if self.stream_view is None:
+            return
+        cursor = QTextCursor(self._doc)
+        cursor.setPosition(self._tail_pos)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+
+        # Everything up to the last blank line is finished markdown: render
+        # it once and start a fresh block for the tail after it
+        split = content.rfind("\n\n")
+        if split != -1 and split + 2 > self._stable_len:
+            split += 2
+            cursor.insertFragment(QTextDocumentFragment.fromMarkdown(content[self._stable_len:split]))
+            cursor.insertBlock()
+            self._stable_len = split
+            self._tail_pos = cursor.position()
+
+        tail = content[self._stable_len:]
+        if tail:
+            cursor.insertFragment(QTextDocumentFragment.fromMarkdown(tail))
+
+    def render_placeholder(self):
+        """Show a cheap plain-text preview until the bubble scrolls into view."""
+        preview = self.content[:self.PLACEHOLDER_CHARS]
+        if len(self.content) > self.PLACEHOLDER_CHARS:
+            preview += "…"
+        self.content_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.content_label.setText(preview)
+        self.is_rendered = False
+
+    def render_full(self):
+        """Render the full content; assistant replies are shown as markdown."""
+        if self.role == "user":
+            self.content_label.setTextFormat(Qt.TextFormat.AutoText)
+        else:
+            self.content_label.setTextFormat(Qt.TextFormat.MarkdownText)
+        self.content_label.setText(self.content)
+        self.is_rendered = True
 
     def update_content(self, content: str):
-        """Update the message content."""
-        # Find the content label and update it
-        for i in range(self.layout().count()):
-            item = self.layout().itemAt(i)
-            if item and item.widget():
-                widget = item.widget()
-                if isinstance(widget, QLabel) and widget.wordWrap():
-                    widget.setText(content)
-                    break
+        """Replace the message content; streamed replies render as markdown."""
+        self.content = content
+        if self.stream_view is not None:
+            self._doc.setMarkdown(content)
+            self.is_rendered = True
+        else:
+            self.render_full()
+        self.setAccessibleName(f"{self.role_text} says: {content[:100]}...")
+
+    def reset(self):
+        """Drop the message so the bubble can wait in the pool."""
+        self.content = ""
+        self.reasoning = {}
+        self.content_label.clear()
+        self.is_rendered = False
+        self._last_style_key = None
+
+    def rebind(self, role: str, content: str, reasoning: dict = None, lazy: bool = False):
+        """Show a different static message in this (pooled) bubble."""
+        self.role = role
+        self.reasoning = reasoning or {}
+        self.content = content
+        self.role_text = "You" if role == "user" else "AI Consultant"
+        self.role_label.setText(self.role_text)
+        self.update_style(self.style_key(get_colors()))
+        if lazy:
+            self.render_placeholder()
+        else:
+            self.render_full()
+        self.setAccessibleName(f"{self.role_text} says: {content[:100]}...")
+
+    @staticmethod
+    def style_key(colors: dict) -> tuple:
+        """Colors that determine bubble styling, as a comparable key."""
+        return (
+            colors['primary'], colors['tertiary'],
+            colors['dark_card'], colors.get('dark_border', '#1c2a4a'),
+        )
 
-    def update_style(self):
-        """Re-apply bubble style with current colors."""
-        from config.settings import get_colors
-        c = get_colors()
+    def update_style(self, style_key: tuple):
+        """Re-apply bubble style, skipping bubbles already using these colors."""
+        if style_key == self._last_style_key:
+            return
+        self._last_style_key = style_key
+
+        user_bg, user_border, assistant_bg, assistant_border = style_key
         is_user = self.role == "user"
-        border_color = c['tertiary'] if is_user else c.get('dark_border', '#1c2a4a')
         self.setStyleSheet(f"""
             QFrame {{
-                background-color: {c['primary'] if is_user else c['dark_card']};
-                border: 1px solid {border_color};
+                background-color: {user_bg if is_user else assistant_bg};
+                border: 1px solid {user_border if is_user else assistant_border};
                 border-radius: 16px;
                 padding: 16px 20px;
                 margin: 8px 0;
@@ -310,15 +521,36 @@ class PhaseIndicator(QFrame):
     def __init__(self, phase_key: str, phase_name: str, status: str):
         super().__init__()
         self.phase_key = phase_key
-        self.status = status
+        self.phase_name = phase_name
+        self.status = None
         self.setup_ui(phase_name)
+        self.set_status(status)
 
     def setup_ui(self, phase_name: str):
         """Set up the indicator UI."""
-        if self.status == "completed":
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(8, 4, 8, 4)
+
+        self.icon_label = QLabel()
+        self.icon_label.setStyleSheet("font-size: 14px;")
+        layout.addWidget(self.icon_label)
+
+        name_label = QLabel(phase_name)
+        name_label.setStyleSheet("font-size: 14px;")
+        layout.addWidget(name_label)
+
+        layout.addStretch()
+
+    def set_status(self, status: str):
+        """Update the indicator for a new status, skipping unchanged ones."""
+        if status == self.status:
+            return
+        self.status = status
+
+        if status == "completed":
             bg_color = COLORS['success']
             icon = "✓"
-        elif self.status == "current":
+        elif status == "current":
             bg_color = COLORS['primary']
             icon = "→"
         else:
@@ -333,23 +565,11 @@ class PhaseIndicator(QFrame):
                 margin: 2px 0;
             }}
         """)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-
-        icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 14px;")
-        layout.addWidget(icon_label)
-
-        name_label = QLabel(phase_name)
-        name_label.setStyleSheet("font-size: 14px;")
-        layout.addWidget(name_label)
-
-        layout.addStretch()
+        self.icon_label.setText(icon)
 
         # Accessibility
-        status_text = "completed" if self.status == "completed" else "current" if self.status == "current" else "pending"
-        self.setAccessibleName(f"{phase_name}: {status_text}")
+        status_text = "completed" if status == "completed" else "current" if status == "current" else "pending"
+        self.setAccessibleName(f"{self.phase_name}: {status_text}")
 
 
 class ReasoningDialog(QDialog):
@@ -385,7 +605,7 @@ class ReasoningDialog(QDialog):
         title_layout.setContentsMargins(24, 24, 24, 16)
 
         title = QLabel("AI Reasoning & Sources")
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(shared_font(20, bold=True))
         title_layout.addWidget(title)
 
         subtitle = QLabel("Understanding how recommendations are generated")
@@ -535,7 +755,7 @@ class ReasoningDialog(QDialog):
 
             principle_text = QLabel(f'"{reasoning["principle"]}"')
             principle_text.setWordWrap(True)
-            principle_text.setFont(QFont("Arial", 14))
+            principle_text.setFont(shared_font(14))
             principle_text.setStyleSheet("font-style: italic;")
             principle_layout.addWidget(principle_text)
 
@@ -583,9 +803,9 @@ class ReasoningDialog(QDialog):
         content_label.setWordWrap(True)
 
         if is_header:
-            content_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+            content_label.setFont(shared_font(16, bold=True))
         elif highlight_color:
-            content_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+            content_label.setFont(shared_font(14, bold=True))
             content_label.setStyleSheet(f"color: {highlight_color};")
         else:
             content_label.setStyleSheet("font-size: 14px;")
@@ -597,6 +817,22 @@ class ReasoningDialog(QDialog):
 class ChatWidget(QWidget):
     """Main chat interface widget."""
 
+    # Streamed chunks are coalesced and painted at most this often (~30 fps)
+    STREAM_FLUSH_MS = 33
+
+    # Restored conversations only build bubbles for the most recent page;
+    # older pages are materialized when the user asks for them
+    MESSAGE_PAGE_SIZE = 40
+
+    # Layout slot of the first bubble; slot 0 holds the "earlier" button
+    FIRST_BUBBLE_INDEX = 1
+
+    # Static bubbles kept for reuse when the message list is cleared
+    BUBBLE_POOL_SIZE = 32
+
+    # Messages replayed into the AI history when a saved session is resumed
+    MAX_AI_HISTORY = 32
+
     back_to_dashboard = pyqtSignal()
     session_saved = pyqtSignal()
 
@@ -605,9 +841,38 @@ class ChatWidget(QWidget):
         self.ai = ai_manager
         self.conversation = conversation_manager
         self.current_ai_bubble = None
-        self.ai_worker = None
         self.is_temporary = False
         self.current_response = ""
+        self._rendered_len = 0
+        self._message_bubbles = []
+        self._next_insert_index = self.FIRST_BUBBLE_INDEX
+        self._lazy_bubbles = []
+        self._bubble_pool: list[MessageBubble] = []
+        self._history = []
+        self._history_start = 0
+        self._export_worker = None
+        self._export_progress = None
+        self._scroll_pending = False
+        self._scroll_stick = False
+        self._pin_to_bottom = False
+        self._phase_indicators = {}
+        self._last_progress_percent = None
+        self._last_progress_counts = None
+
+        # Batch streamed chunks so the bubble re-lays out once per interval
+        self._stream_flush_timer = QTimer(self)
+        self._stream_flush_timer.setSingleShot(True)
+        self._stream_flush_timer.setInterval(self.STREAM_FLUSH_MS)
+        self._stream_flush_timer.timeout.connect(self._flush_stream)
+
+        # Single persistent worker serving every AI turn
+        self.ai_worker = AIWorker(self.ai)
+        self.ai_worker.chunk_received.connect(self.on_chunk_received)
+        self.ai_worker.response_finished.connect(self.on_response_finished)
+        self.ai_worker.error.connect(self.on_response_error)
+        self.ai_worker.finished.connect(self.ai_worker.deleteLater)
+        self.ai_worker.start()
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -636,7 +901,7 @@ class ChatWidget(QWidget):
         header.addWidget(back_btn)
 
         self.session_title = QLabel("Consultation")
-        self.session_title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        self.session_title.setFont(shared_font(20, bold=True))
         header.addWidget(self.session_title)
 
         header.addStretch()
@@ -690,9 +955,27 @@ class ChatWidget(QWidget):
         self.messages_layout = QVBoxLayout(self.messages_container)
         self.messages_layout.setSpacing(12)
         self.messages_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.messages_layout.addStretch()
+
+        # Loads the previous page of a long restored conversation
+        self.earlier_btn = QPushButton("Show earlier messages")
+        self.earlier_btn.setProperty("class", "text")
+        self.earlier_btn.setAccessibleName("Show earlier messages")
+        self.earlier_btn.setMinimumHeight(44)
+        self.earlier_btn.clicked.connect(self.show_earlier_messages)
+        self.earlier_btn.hide()
+        self.messages_layout.addWidget(self.earlier_btn)
+
+        # Trailing filler that keeps bubbles packed at the top; bubbles are
+        # inserted at _next_insert_index, just before it
+        self._messages_end = QWidget()
+        self._messages_end.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.messages_layout.addWidget(self._messages_end)
 
         self.messages_scroll.setWidget(self.messages_container)
+        scrollbar = self.messages_scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self._render_visible_bubbles)
+        scrollbar.rangeChanged.connect(self._on_scroll_range_changed)
+        scrollbar.actionTriggered.connect(self._release_bottom_pin)
         chat_layout.addWidget(self.messages_scroll)
 
         # Input area
@@ -772,7 +1055,7 @@ class ChatWidget(QWidget):
 
         # Progress header
         progress_label = QLabel("Progress")
-        progress_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        progress_label.setFont(shared_font(18, bold=True))
         sidebar_layout.addWidget(progress_label)
 
         # Progress bar
@@ -787,14 +1070,14 @@ class ChatWidget(QWidget):
 
         # Phase indicators
         phases_label = QLabel("Phases")
-        phases_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        phases_label.setFont(shared_font(14, bold=True))
         phases_label.setStyleSheet("margin-top: 16px;")
         sidebar_layout.addWidget(phases_label)
 
-        self.phases_container = QWidget()
-        self.phases_layout = QVBoxLayout(self.phases_container)
+        # Indicators sit directly in the sidebar; no wrapper widget needed
+        self.phases_layout = QVBoxLayout()
         self.phases_layout.setSpacing(4)
-        sidebar_layout.addWidget(self.phases_container)
+        sidebar_layout.addLayout(self.phases_layout)
 
         sidebar_layout.addStretch()
 
@@ -809,18 +1092,13 @@ class ChatWidget(QWidget):
 
         # Resources link
         resources_label = QLabel("Resources")
-        resources_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        resources_label.setFont(shared_font(14, bold=True))
         resources_label.setStyleSheet("margin-top: 16px;")
         sidebar_layout.addWidget(resources_label)
 
-        resources = [
-            ("UDL Guidelines", "https://udlguidelines.cast.org"),
-            ("WCAG 2.1", "https://www.w3.org/WAI/WCAG21/quickref/"),
-            ("A11Y Project", "https://www.a11yproject.com"),
-        ]
-
-        for name, url in resources:
-            link = QLabel(f'<a href="{url}" style="color: {COLORS["primary_text"]};">{name}</a>')
+        link_colors = {"primary": COLORS["primary_text"]}
+        for link_html in RESOURCE_LINKS_HTML:
+            link = QLabel(link_html.format_map(link_colors))
             link.setOpenExternalLinks(True)
             link.setStyleSheet("font-size: 14px;")
             sidebar_layout.addWidget(link)
@@ -848,26 +1126,41 @@ class ChatWidget(QWidget):
         self.ai.reset_conversation()
 
         # Clear existing messages
-        while self.messages_layout.count() > 1:  # Keep the stretch
-            item = self.messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Load existing conversation
-        for msg in self.conversation.get_conversation():
-            bubble = MessageBubble(msg["role"], msg["content"], msg.get("reasoning"))
-            self.messages_layout.insertWidget(self.messages_layout.count() - 1, bubble)
+        self._clear_messages()
+
+        # Load existing conversation with painting suspended so the layout
+        # is computed once for the whole batch rather than per bubble
+        messages = self.conversation.get_conversation()
+        self._history = messages
+        self._history_start = max(0, len(messages) - self.MESSAGE_PAGE_SIZE)
+        self.earlier_btn.setVisible(self._history_start > 0)
+        self.messages_scroll.setUpdatesEnabled(False)
+        self.messages_container.setUpdatesEnabled(False)
+        try:
+            for msg in messages[self._history_start:]:
+                bubble = self._get_bubble(msg["role"], msg["content"], msg.get("reasoning"), lazy=True)
+                self._append_bubble(bubble)
+                self._lazy_bubbles.append(bubble)
+        finally:
+            self.messages_container.setUpdatesEnabled(True)
+            self.messages_scroll.setUpdatesEnabled(True)
+        self.messages_layout.activate()
 
-            # Restore AI history
-            self.ai.add_to_history(msg["role"], msg["content"])
+        # Restore AI history; only the most recent messages are replayed
+        ai_messages = messages[-self.MAX_AI_HISTORY:]
+        self.ai.extend_history([(msg["role"], msg["content"]) for msg in ai_messages])
 
         self.update_progress()
 
         # If no messages, start with AI greeting
-        if not self.conversation.get_conversation():
+        if not messages:
             self.start_consultation()
 
-        self.scroll_to_bottom()
+        # Rendering the restored bubbles grows them after the first scroll,
+        # so stay pinned to the bottom until the user scrolls away
+        self._pin_to_bottom = True
+        self.scroll_to_bottom(force=True)
+        QTimer.singleShot(0, self._render_visible_bubbles)
 
     def load_temporary_session(self):
         """Load a temporary session (not saved to database yet)."""
@@ -883,16 +1176,16 @@ class ChatWidget(QWidget):
         self.ai.reset_conversation()
 
         # Clear existing messages
-        while self.messages_layout.count() > 1:  # Keep the stretch
-            item = self.messages_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._clear_messages()
+        self._history = []
+        self._history_start = 0
+        self.earlier_btn.hide()
 
         self.update_progress()
 
         # Start with AI greeting
         self.start_consultation()
-        self.scroll_to_bottom()
+        self.scroll_to_bottom(force=True)
 
     def save_session(self):
         """Save a temporary session to the database."""
@@ -924,26 +1217,32 @@ class ChatWidget(QWidget):
 
     def send_message(self):
         """Send user message and get AI response."""
-        try:
-            message = self.message_input.toPlainText().strip()
-            if not message:
-                return
-
-            # Disable input while processing
-            self.message_input.setEnabled(False)
-            self.send_btn.setEnabled(False)
+        message = self.message_input.toPlainText().strip()
+        if not message or self.ai_worker.busy:
+            return
 
-            # Add user message
-            user_bubble = MessageBubble("user", message)
-            self.messages_layout.insertWidget(self.messages_layout.count() - 1, user_bubble)
+        # Disable input while processing
+        self.message_input.setEnabled(False)
+        self.send_btn.setEnabled(False)
 
-            # Save to conversation
+        # Save to conversation first; the typed text stays in the input
+        # and no bubble is shown if the save fails
+        try:
             self.conversation.add_message("user", message)
+        except SQLAlchemyError as e:
+            self.message_input.setEnabled(True)
+            self.send_btn.setEnabled(True)
+            QMessageBox.warning(self, "Error", f"Failed to save message: {str(e)}")
+            return
 
-            self.message_input.clear()
-            self.scroll_to_bottom()
+        # Add user message
+        user_bubble = self._get_bubble("user", message)
+        self._append_bubble(user_bubble)
+        self.message_input.clear()
+        self.scroll_to_bottom(force=True)
 
-            # Get AI response
+        # Get AI response
+        try:
             self.get_ai_response(message)
         except Exception as e:
             # Re-enable input on error
@@ -971,16 +1270,13 @@ class ChatWidget(QWidget):
             }
 
             # Create placeholder bubble for streaming
-            self.current_ai_bubble = MessageBubble("assistant", "Thinking...")
-            self.messages_layout.insertWidget(self.messages_layout.count() - 1, self.current_ai_bubble)
+            self.current_ai_bubble = MessageBubble("assistant", "Thinking...", streaming=True)
+            self._append_bubble(self.current_ai_bubble)
             self.current_response = ""
+            self._rendered_len = 0
 
-            # Start worker thread
-            self.ai_worker = AIWorker(self.ai, user_message, phase_context)
-            self.ai_worker.chunk_received.connect(self.on_chunk_received)
-            self.ai_worker.finished.connect(self.on_response_finished)
-            self.ai_worker.error.connect(self.on_response_error)
-            self.ai_worker.start()
+            # Hand the request to the persistent worker
+            self.ai_worker.submit(user_message, phase_context)
         except Exception as e:
             # Re-enable input on error
             self.message_input.setEnabled(True)
@@ -993,26 +1289,31 @@ class ChatWidget(QWidget):
     def on_chunk_received(self, chunk: str):
         """Handle received chunk from AI."""
         self.current_response += chunk
-        if self.current_ai_bubble:
-            self.current_ai_bubble.update_content(self.current_response)
-        self.scroll_to_bottom()
+        if not self._stream_flush_timer.isActive():
+            self._stream_flush_timer.start()
+
+    def _flush_stream(self):
+        """Push the accumulated response into the streaming bubble."""
+        self._stream_flush_timer.stop()
+        if self.current_ai_bubble and self._rendered_len < len(self.current_response):
+            self.current_ai_bubble.stream_markdown(self.current_response)
+            self._rendered_len = len(self.current_response)
+            self.scroll_to_bottom()
 
     @pyqtSlot()
     def on_response_finished(self):
         """Handle AI response completion."""
+        # Drain any chunks still waiting on the flush timer, then render the
+        # markdown once for the complete reply
+        self._flush_stream()
+        if self.current_ai_bubble:
+            self.current_ai_bubble.update_content(self.current_response)
         try:
             # Save message to conversation
             reasoning = self.conversation.get_phase_reasoning()
             self.conversation.add_message("assistant", self.current_response, reasoning)
-
-            # Update progress
-            self.update_progress()
-
-            # Check if complete
-            if self.conversation.is_complete():
-                self.show_completion_message()
-        except Exception as e:
-            print(f"Error in on_response_finished: {e}")
+        except SQLAlchemyError as e:
+            print(f"Error saving response: {e}")
         finally:
             # Always re-enable input
             self.message_input.setEnabled(True)
@@ -1020,9 +1321,17 @@ class ChatWidget(QWidget):
             self.message_input.setFocus()
             self.current_ai_bubble = None
 
+        # Update progress
+        self.update_progress()
+
+        # Check if complete
+        if self.conversation.is_complete():
+            self.show_completion_message()
+
     @pyqtSlot(str)
     def on_response_error(self, error: str):
         """Handle AI response error."""
+        self._stream_flush_timer.stop()
         try:
             if self.current_ai_bubble:
                 self.current_ai_bubble.update_content(f"Error: {error}\n\nPlease check your AI settings and try again.")
@@ -1036,37 +1345,172 @@ class ChatWidget(QWidget):
     def add_ai_message(self, content: str):
         """Add an AI message to the chat."""
         reasoning = self.conversation.get_phase_reasoning()
-        bubble = MessageBubble("assistant", content, reasoning)
-        self.messages_layout.insertWidget(self.messages_layout.count() - 1, bubble)
+        bubble = self._get_bubble("assistant", content, reasoning)
+        self._append_bubble(bubble)
 
         self.conversation.add_message("assistant", content, reasoning)
         self.scroll_to_bottom()
 
+    def _append_bubble(self, bubble: MessageBubble):
+        """Add a message bubble after the existing ones."""
+        self.messages_layout.insertWidget(self._next_insert_index, bubble)
+        self._next_insert_index += 1
+        self._message_bubbles.append(bubble)
+
+    def _get_bubble(self, role: str, content: str, reasoning: dict = None,
+                    lazy: bool = False) -> MessageBubble:
+        """Take a static bubble from the pool, or build one if it is empty."""
+        if self._bubble_pool:
+            bubble = self._bubble_pool.pop()
+            bubble.rebind(role, content, reasoning, lazy=lazy)
+            return bubble
+        return MessageBubble(role, content, reasoning, lazy=lazy)
+
+    def _recycle_bubble(self, bubble: MessageBubble):
+        """Return a removed bubble to the pool; streamed ones are destroyed."""
+        if bubble.stream_view is not None or len(self._bubble_pool) >= self.BUBBLE_POOL_SIZE:
+            bubble.deleteLater()
+            return
+        bubble.reset()
+        bubble.setParent(None)
+        self._bubble_pool.append(bubble)
+
+    def _clear_messages(self):
+        """Remove every message bubble from the chat."""
+        # Bubbles occupy the layout slots after the "earlier" button in order;
+        # taking them from the end keeps each removal O(1) and leaves nothing
+        # for the layout to search for when the widgets are later destroyed.
+        for index in range(self._next_insert_index - 1, self.FIRST_BUBBLE_INDEX - 1, -1):
+            self.messages_layout.takeAt(index)
+        for bubble in self._message_bubbles:
+            self._recycle_bubble(bubble)
+        self._message_bubbles.clear()
+        self._lazy_bubbles.clear()
+        self._next_insert_index = self.FIRST_BUBBLE_INDEX
+
+    def show_earlier_messages(self):
+        """Materialize the previous page of the restored conversation."""
+        if self._history_start == 0:
+            return
+
+        start = max(0, self._history_start - self.MESSAGE_PAGE_SIZE)
+        page = self._history[start:self._history_start]
+
+        self._pin_to_bottom = False
+        scrollbar = self.messages_scroll.verticalScrollBar()
+        distance_from_bottom = scrollbar.maximum() - scrollbar.value()
+
+        bubbles = []
+        self.messages_container.setUpdatesEnabled(False)
+        try:
+            for offset, msg in enumerate(page):
+                bubble = self._get_bubble(msg["role"], msg["content"], msg.get("reasoning"), lazy=True)
+                self.messages_layout.insertWidget(self.FIRST_BUBBLE_INDEX + offset, bubble)
+                bubbles.append(bubble)
+        finally:
+            self.messages_container.setUpdatesEnabled(True)
+        self.messages_layout.activate()
+
+        self._message_bubbles[:0] = bubbles
+        self._next_insert_index += len(bubbles)
+        self._lazy_bubbles.extend(bubbles)
+        self._history_start = start
+        self.earlier_btn.setVisible(start > 0)
+
+        # Keep the messages the user was reading in place
+        QTimer.singleShot(0, lambda: scrollbar.setValue(scrollbar.maximum() - distance_from_bottom))
+
+    def _render_visible_bubbles(self, *_):
+        """Fully render restored bubbles that are in or near the viewport."""
+        if not self._lazy_bubbles:
+            return
+
+        # Render one viewport ahead in each direction to hide the swap
+        viewport_height = self.messages_scroll.viewport().height()
+        top = self.messages_scroll.verticalScrollBar().value() - viewport_height
+        bottom = top + 3 * viewport_height
+
+        pending = []
+        for bubble in self._lazy_bubbles:
+            geometry = bubble.geometry()
+            if geometry.bottom() >= top and geometry.top() <= bottom:
+                bubble.render_full()
+            elif not bubble.is_rendered:
+                pending.append(bubble)
+        self._lazy_bubbles = pending
+
     def update_progress(self):
         """Update the progress indicators."""
         progress = self.conversation.get_progress()
 
-        self.progress_bar.setValue(int(progress["percent"]))
-        self.progress_text.setText(f"{int(progress['percent'])}% complete ({progress['completed_questions']}/{progress['total_questions']} questions)")
+        percent = int(progress["percent"])
+        if percent != self._last_progress_percent:
+            self.progress_bar.setValue(percent)
+            self._last_progress_percent = percent
 
-        # Update phase indicators
-        while self.phases_layout.count():
-            item = self.phases_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        for phase_info in progress["phases"]:
-            indicator = PhaseIndicator(
-                phase_info["key"],
-                phase_info["name"],
-                phase_info["status"]
+        # Compare the raw counts so an unchanged label isn't even formatted
+        counts = (percent, progress["completed_questions"], progress["total_questions"])
+        if counts != self._last_progress_counts:
+            self.progress_text.setText(
+                f"{percent}% complete ({counts[1]}/{counts[2]} questions)"
             )
-            self.phases_layout.addWidget(indicator)
+            self._last_progress_counts = counts
+
+        # Update phase indicators in place, only creating or removing the
+        # widgets whose phases actually appeared or disappeared
+        phase_keys = {phase_info["key"] for phase_info in progress["phases"]}
+        for key in [k for k in self._phase_indicators if k not in phase_keys]:
+            indicator = self._phase_indicators.pop(key)
+            self.phases_layout.removeWidget(indicator)
+            indicator.deleteLater()
+
+        for index, phase_info in enumerate(progress["phases"]):
+            indicator = self._phase_indicators.get(phase_info["key"])
+            if indicator is None:
+                indicator = PhaseIndicator(
+                    phase_info["key"],
+                    phase_info["name"],
+                    phase_info["status"]
+                )
+                self._phase_indicators[phase_info["key"]] = indicator
+                self.phases_layout.insertWidget(index, indicator)
+            else:
+                indicator.set_status(phase_info["status"])
+
+    def scroll_to_bottom(self, force: bool = False):
+        """Scroll messages to bottom on the next event-loop turn.
+
+        Repeated calls within one turn collapse into a single scroll. Unless
+        forced, the view only follows new content when it was already at the
+        bottom, so reading earlier messages isn't interrupted.
+        """
+        if not force and not self._scroll_stick:
+            scrollbar = self.messages_scroll.verticalScrollBar()
+            self._scroll_stick = scrollbar.value() >= scrollbar.maximum() - 4
+        else:
+            self._scroll_stick = True
 
-    def scroll_to_bottom(self):
-        """Scroll messages to bottom."""
-        scrollbar = self.messages_scroll.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(0, self._do_scroll)
+
+    def _do_scroll(self):
+        """Perform a scroll requested by scroll_to_bottom."""
+        self._scroll_pending = False
+        if self._scroll_stick:
+            scrollbar = self.messages_scroll.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        self._scroll_stick = False
+
+    def _on_scroll_range_changed(self, _minimum: int, maximum: int):
+        """Keep a freshly loaded session at the bottom while bubbles render."""
+        if self._pin_to_bottom:
+            self.messages_scroll.verticalScrollBar().setValue(maximum)
+
+    def _release_bottom_pin(self, *_):
+        """Stop following the bottom once the user scrolls themselves."""
+        self._pin_to_bottom = False
 
     def show_reasoning(self):
         """Show the AI reasoning dialog."""
@@ -1099,29 +1543,58 @@ class ChatWidget(QWidget):
             if not filepath.endswith(".docx"):
                 filepath += ".docx"
 
-            success = self.conversation.export_to_docx(filepath)
-            if success:
-                QMessageBox.information(
-                    self,
-                    "Export Successful",
-                    f"Consultation exported to:\n{filepath}"
-                )
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Export Failed",
-                    "Failed to export consultation. Please try again."
-                )
+            # Write the document on the thread pool so the UI stays responsive
+            self._export_progress = QProgressDialog("Exporting consultation...", None, 0, 0, self)
+            self._export_progress.setWindowTitle("Export Consultation")
+            self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._export_progress.setMinimumDuration(0)
+            self._export_progress.show()
+
+            self._export_worker = ExportWorker(self.conversation, filepath)
+            self._export_worker.signals.done.connect(self.on_export_finished)
+            QThreadPool.globalInstance().start(self._export_worker)
+
+    @pyqtSlot(bool, str)
+    def on_export_finished(self, success: bool, filepath: str):
+        """Handle completion of a background export."""
+        if self._export_progress:
+            self._export_progress.close()
+            self._export_progress = None
+        self._export_worker = None
+
+        if success:
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"Consultation exported to:\n{filepath}"
+            )
+        else:
+            QMessageBox.warning(
+                self,
+                "Export Failed",
+                "Failed to export consultation. Please try again."
+            )
 
     def refresh_styles(self):
         """Re-apply styles after accessibility settings change."""
-        # Update existing message bubbles with new colors
-        for i in range(self.messages_layout.count()):
-            item = self.messages_layout.itemAt(i)
-            if item and item.widget() and isinstance(item.widget(), MessageBubble):
-                item.widget().update_style()
+        # Update existing message bubbles with new colors; the key is built
+        # once so unchanged bubbles skip the stylesheet reparse entirely
+        style_key = MessageBubble.style_key(get_colors())
+        self.setUpdatesEnabled(False)
+        try:
+            for bubble in self._message_bubbles:
+                bubble.update_style(style_key)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def show_tutorial(self):
         """Show the chat tutorial."""
         dialog = ChatTutorialDialog(self)
         dialog.exec()
+
+    def shutdown(self):
+        """Stop the AI worker thread before the application exits."""
+        self._stream_flush_timer.stop()
+        if self.ai_worker is not None:
+            self.ai_worker.stop()
+            self.ai_worker = None
@@ -1,48 +1,363 @@
 """Dashboard screen with session management."""
 
 import asyncio
+import hashlib
+import io
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache, partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QScrollArea, QGridLayout, QDialog, QLineEdit,
     QComboBox, QMessageBox, QSizePolicy, QTextEdit, QProgressBar,
-    QFileDialog
+    QFileDialog, QFormLayout, QListView, QStyledItemDelegate
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QRunnable, QThread, QThreadPool, QTimer, pyqtSlot,
+    QAbstractListModel, QModelIndex, QRectF, QSize
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter, QTextCursor
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
-from config.settings import COLORS, get_colors
+from config.settings import COLORS, APP_SETTINGS
 from prompts.system_prompts import CONSULTATION_TYPES
-from core.database import DatabaseManager, Session, ConsultOverview
+from core.database import DatabaseManager, ConsultOverview, OverviewDisplayRow, SessionDisplayRow
 from core.auth import AuthManager
+from ui.styles import SCROLL_AREA_STYLE, shared_font
+
+
+# Stylesheets for the dialogs and dashboard chrome, built once from the
+# base palette instead of on every setup_ui call.
+_OVERVIEW_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['dark_card']};
+    }}
+    QLabel {{
+        color: {COLORS['text']};
+    }}
+    QTextEdit {{
+        background-color: {COLORS['dark_input']};
+        color: {COLORS['text']};
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 14px;
+    }}
+    QTextEdit:focus {{
+        border: 1px solid {COLORS['primary']};
+        padding: 11px;
+    }}
+    QProgressBar {{
+        border: none;
+        border-radius: 4px;
+        background-color: {COLORS['dark_input']};
+        text-align: center;
+    }}
+    QProgressBar::chunk {{
+        background-color: {COLORS['primary']};
+        border-radius: 4px;
+    }}
+"""
+
+_VIEW_OVERVIEW_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['dark_card']};
+    }}
+    QLabel {{
+        color: {COLORS['text']};
+    }}
+    QTextEdit {{
+        background-color: {COLORS['dark_input']};
+        color: {COLORS['text']};
+        border: none;
+        border-radius: 8px;
+        padding: 12px;
+        font-size: 14px;
+    }}
+    QTextEdit:focus {{
+        border: 1px solid {COLORS['primary']};
+        padding: 11px;
+    }}
+"""
+
+_NOTES_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['dark_card']};
+    }}
+    QLabel {{
+        color: {COLORS['text']};
+    }}
+    QTextEdit {{
+        background-color: {COLORS['dark_input']};
+        color: {COLORS['text']};
+        border: none;
+        border-radius: 8px;
+        padding: 8px;
+        font-size: 14px;
+    }}
+    QTextEdit:focus {{
+        border: 1px solid {COLORS['primary']};
+        padding: 7px;
+    }}
+"""
+
+_NOTES_LIST_QSS = f"""
+    QListView {{
+        border: 1px solid {COLORS['dark_input']};
+        border-radius: 8px;
+        background-color: {COLORS['dark_bg']};
+        padding: 8px;
+    }}
+"""
+
+_CAPTION_QSS = f"color: {COLORS['text_muted']}; font-size: 11px;"
+_SMALL_CAPTION_QSS = f"color: {COLORS['text_muted']}; font-size: 12px;"
+_OVERVIEW_DESC_QSS = f"color: {COLORS['text_muted']}; font-size: 13px;"
+_TYPE_DESCRIPTION_QSS = f"color: {COLORS['text_muted']}; font-size: 14px;"
+# Overview status line colour for each generation state
+_OVERVIEW_STATUS_QSS = {
+    state: f"color: {COLORS[color]}; font-size: 13px;"
+    for state, color in (("working", "primary"), ("done", "success"), ("error", "error"))
+}
+_TUTORIAL_CONTENT_QSS = f"color: {COLORS['text']}; line-height: 1.5;"
+_NOTES_EMPTY_QSS = f"color: {COLORS['text_muted']}; font-style: italic;"
+
+_TUTORIAL_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['dark_card']};
+    }}
+    QLabel {{
+        color: {COLORS['text']};
+    }}
+"""
+
+_NEW_SESSION_QSS = f"""
+    QDialog {{
+        background-color: {COLORS['dark_card']};
+    }}
+"""
+
+_TOAST_QSS = f"""
+    QLabel {{
+        background-color: {COLORS['secondary']};
+        color: {COLORS['text']};
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-size: 14px;
+    }}
+"""
+
+_OVERVIEW_TIMESTAMP_FORMAT = "%B %d, %Y at %I:%M %p"
+_CARD_TIMESTAMP_FORMAT = "%b %d, %Y at %I:%M %p"
+
+
+@lru_cache(maxsize=256)
+def _format_card_timestamp(moment: datetime) -> str:
+    """Format a card's modified/created time (memoized; reloads mostly show the same rows)."""
+    return moment.strftime(_CARD_TIMESTAMP_FORMAT)
+
+
+# Markdown line prefixes for the Word export -> (kind, heading level).
+# Prefixes are 2-4 characters; lines are probed longest first.
+_MD_PREFIXES = {
+    "### ": ("heading", 2),
+    "## ": ("heading", 1),
+    "# ": ("heading", 1),
+    "- ": ("bullet", None),
+    "* ": ("bullet", None),
+    "• ": ("bullet", None),
+}
+_MD_NUMBERED_RE = re.compile(r"\d{1,3}[.):]\s*(.*)")
+_MD_BOLD_RE = re.compile(r"\*\*(.+)\*\*")
+
+
+def _classify_markdown_line(line: str) -> tuple:
+    """Return (kind, heading level, text) for a stripped line; kind is None for plain text."""
+    for width in (4, 3, 2):
+        rule = _MD_PREFIXES.get(line[:width])
+        if rule is not None:
+            return rule[0], rule[1], line[width:]
+    match = _MD_NUMBERED_RE.match(line)
+    if match:
+        return "numbered", None, match.group(1)
+    match = _MD_BOLD_RE.fullmatch(line)
+    if match:
+        return "bold", None, match.group(1)
+    return None, None, line
+
+
+def _open_export_file_dialog(parent: QWidget, default_name: str, on_chosen):
+    """Ask for a .docx save path without a nested event loop; on_chosen(path) runs on accept."""
+    dialog = QFileDialog(parent, "Export Overview", "", "Word Document (*.docx)")
+    dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+    dialog.selectFile(default_name)
+    dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    dialog.fileSelected.connect(on_chosen)
+    dialog.open()
+
+
+class DocxExportSignals(QObject):
+    """Signals emitted by DocxExportWorker."""
+
+    done = pyqtSignal(str, str)  # filepath, error message ("" on success)
+
+
+class DocxExportWorker(QRunnable):
+    """Thread-pool task that builds and saves an overview Word document."""
+
+    def __init__(self, write_document, filepath: str):
+        super().__init__()
+        self.write_document = write_document
+        self.filepath = filepath
+        self.signals = DocxExportSignals()
+
+    def run(self):
+        """Run the export."""
+        try:
+            self.write_document(self.filepath)
+            error = ""
+        except Exception as e:
+            error = str(e)
+        self.signals.done.emit(self.filepath, error)
 
 
 class OverviewWorker(QThread):
-    """Worker thread for generating AI overview."""
+    """Worker thread that gathers a user's consultations and generates the AI overview."""
 
+    gathered = pyqtSignal(int)  # number of consultations analyzed
+    no_data = pyqtSignal(str, str)  # message box title, text
     chunk_received = pyqtSignal(str)
-    finished = pyqtSignal(str)
+    overview_finished = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, ai_manager, conversations_text: str):
+    # Streamed chunks are batched for up to this many seconds or chunks
+    EMIT_INTERVAL = 0.016
+    EMIT_MAX_CHUNKS = 32
+
+    def __init__(self, ai_manager, db_manager: DatabaseManager, user_id: int, gather_cache: dict):
         super().__init__()
         self.ai_manager = ai_manager
-        self.conversations_text = conversations_text
-        self.full_response = ""
+        self.db = db_manager
+        self.user_id = user_id
+        # Owned by the dialog: versions key -> (sessions count, conversations text)
+        self.gather_cache = gather_cache
+        self._chunks: list[str] = []
+        self._loop = None
+        self._task = None
+        # Set by stop(); run() checks it around the points where no task exists yet
+        self._stop_requested = False
+
+    def start(self, *args):
+        """Start a run with any earlier stop request cleared."""
+        self._stop_requested = False
+        super().start(*args)
+
+    def stop(self):
+        """Cancel any running generation and wait for the thread to exit."""
+        if not self.isRunning():
+            return
+        self._stop_requested = True
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
+        self.wait()
+
+    def _gather_conversations(self, sessions) -> str:
+        """Gather conversation text from sessions (most recent first) within the prompt budget."""
+        max_messages = APP_SETTINGS["overview_max_messages_per_session"]
+        max_chars = APP_SETTINGS["overview_max_chars"]
+        buf = io.StringIO()
+        first = True
+        written = 0
+        truncated = False
+
+        for full_session in sessions:
+            conversation = full_session.conversation
+            if not conversation:
+                continue
+
+            # Consultations are separated by a blank line
+            if not first:
+                buf.write("\n")
+            first = False
+
+            buf.write(f"\n--- Consultation: {full_session.title} ({full_session.template_type}) ---\n")
+            buf.write(f"Created: {full_session.created_at.strftime('%Y-%m-%d')}\n\n")
+            # Once the budget is spent, older consultations are listed by header only
+            if truncated:
+                continue
+
+            if len(conversation) > max_messages:
+                buf.write(f"[... {len(conversation) - max_messages} earlier messages omitted ...]\n\n")
+                conversation = conversation[-max_messages:]
+            for msg in conversation:
+                role = "Educator" if msg["role"] == "user" else "AI Consultant"
+                line = f"{role}: {msg.get('content', '')}\n\n"
+                if written + len(line) > max_chars:
+                    buf.write("[... older conversations truncated ...]\n\n")
+                    truncated = True
+                    break
+                buf.write(line)
+                written += len(line)
+
+        return buf.getvalue()
 
     def run(self):
-        """Run the AI analysis."""
-        loop = asyncio.new_event_loop()
+        """Gather the conversations, then run the AI analysis."""
+        self._chunks = []
+        try:
+            versions = self.db.get_user_session_versions(self.user_id)
+            if not versions:
+                self.no_data.emit(
+                    "No Consultations",
+                    "You don't have any consultations yet. Start a consultation first!"
+                )
+                return
+
+            # Reuse the last gathered text while no session has changed
+            key = hashlib.blake2b(repr(sorted(versions)).encode(), digest_size=16).digest()
+            cached = self.gather_cache.get(key)
+            if cached is None:
+                # Get all sessions for the user, conversations included
+                sessions = self.db.get_user_sessions_with_conversations(self.user_id)
+                cached = (len(sessions), self._gather_conversations(sessions))
+                self.gather_cache.clear()
+                self.gather_cache[key] = cached
+            sessions_count, conversations_text = cached
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+
+        # Closed while the conversations were being gathered
+        if self._stop_requested:
+            return
+
+        if not conversations_text.strip():
+            self.no_data.emit(
+                "No Conversation Data",
+                "Your consultations don't have any conversation data yet."
+            )
+            return
+        self.gathered.emit(sessions_count)
+
+        # One event loop serves every generation run by this worker
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        loop = self._loop
         asyncio.set_event_loop(loop)
 
         try:
             prompt = f"""Analyze the following consultation conversations and provide a comprehensive overview report.
 
 CONVERSATIONS DATA:
-{self.conversations_text}
+{conversations_text}
 
 Please provide a structured report with the following sections:
 
@@ -73,35 +388,76 @@ What should this educator focus on learning next? Provide specific resources or
 Format the response in clear markdown with headers and bullet points for readability."""
 
             async def generate():
+                # Tokens are sent to the UI thread in batches rather than one
+                # queued signal per token
+                batch = []
+                last_emit = time.monotonic()
                 try:
                     async for chunk in self.ai_manager.generate_response(prompt, None):
-                        self.full_response += chunk
-                        self.chunk_received.emit(chunk)
+                        self._chunks.append(chunk)
+                        batch.append(chunk)
+                        now = time.monotonic()
+                        if now - last_emit >= self.EMIT_INTERVAL or len(batch) >= self.EMIT_MAX_CHUNKS:
+                            self.chunk_received.emit("".join(batch))
+                            batch = []
+                            last_emit = now
                 except Exception as e:
+                    if batch:
+                        self.chunk_received.emit("".join(batch))
                     self.error.emit(str(e))
-                    return
-
-            loop.run_until_complete(generate())
-            self.finished.emit(self.full_response)
-
+                    return False
+                if batch:
+                    self.chunk_received.emit("".join(batch))
+                return True
+
+            self._task = loop.create_task(generate())
+            # stop() may have run before the task existed, with nothing to cancel
+            if self._stop_requested:
+                self._task.cancel()
+            # A failed stream has already reported its error; don't also save it
+            if loop.run_until_complete(self._task):
+                self.overview_finished.emit("".join(self._chunks))
+
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             self.error.emit(str(e))
         finally:
-            loop.close()
+            self._task = None
+            try:
+                # Release the provider's HTTP session now, not at garbage collection
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                pass
+            asyncio.set_event_loop(None)
+
+    def close_loop(self):
+        """Close the worker's event loop once it will not run again."""
+        if self._loop is not None and not self.isRunning():
+            self._loop.close()
+            self._loop = None
 
 
 class ConsultOverviewDialog(QDialog):
     """Dialog for viewing AI-generated overview of all consultations."""
 
+    # Streamed chunks are written to the document at most this often
+    STREAM_FLUSH_MS = 33
+
     def __init__(self, db_manager: DatabaseManager, auth_manager: AuthManager,
                  ai_manager, parent=None):
         super().__init__(parent)
         self.db = db_manager
         self.auth = auth_manager
         self.ai = ai_manager
-        self.overview_content = ""
+        self._chunks: list[str] = []
+        self._pending_chunks: list[str] = []
+        self._stream_cursor = None
+        self._gather_cache: dict[bytes, tuple[int, str]] = {}
         self.worker = None
+        self._export_worker = None
         self.generated_time = None
+        self.generated_display = ""
         self.sessions_count = 0
         self.saved_overview_id = None
 
@@ -110,34 +466,14 @@ class ConsultOverviewDialog(QDialog):
         self.setMinimumSize(700, 600)
         self.setup_ui()
 
+        self._stream_flush_timer = QTimer(self)
+        self._stream_flush_timer.setSingleShot(True)
+        self._stream_flush_timer.setInterval(self.STREAM_FLUSH_MS)
+        self._stream_flush_timer.timeout.connect(self._flush_pending_chunks)
+
     def setup_ui(self):
         """Set up the overview dialog UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-            }}
-            QTextEdit {{
-                background-color: {COLORS['dark_input']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 14px;
-            }}
-            QProgressBar {{
-                border: none;
-                border-radius: 4px;
-                background-color: {COLORS['dark_input']};
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {COLORS['primary']};
-                border-radius: 4px;
-            }}
-        """)
+        self.setStyleSheet(_OVERVIEW_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -147,14 +483,14 @@ class ConsultOverviewDialog(QDialog):
         header_layout = QHBoxLayout()
 
         title = QLabel("Consultation Overview")
-        title.setFont(QFont("Arial", 22, QFont.Weight.Bold))
+        title.setFont(shared_font(22, bold=True))
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Timestamp
         self.timestamp_label = QLabel("")
-        self.timestamp_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        self.timestamp_label.setStyleSheet(_SMALL_CAPTION_QSS)
         header_layout.addWidget(self.timestamp_label)
 
         layout.addLayout(header_layout)
@@ -165,7 +501,7 @@ class ConsultOverviewDialog(QDialog):
             "assess your learning progress, and provide personalized recommendations."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 13px;")
+        desc.setStyleSheet(_OVERVIEW_DESC_QSS)
         layout.addWidget(desc)
 
         # Progress bar (hidden initially)
@@ -177,7 +513,7 @@ class ConsultOverviewDialog(QDialog):
 
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet(f"color: {COLORS['primary']}; font-size: 13px;")
+        self.status_label.setStyleSheet(_OVERVIEW_STATUS_QSS["working"])
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.status_label)
 
@@ -220,107 +556,156 @@ class ConsultOverviewDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def reset(self):
+        """Return to the initial empty state before the dialog is shown again."""
+        # done() has already cancelled any generation; let the thread finish exiting
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()
+        # An export still writing keeps its state; on_export_finished restores the buttons
+        if self._export_worker is not None:
+            return
+        self._stream_flush_timer.stop()
+        self._set_content("")
+        self._stream_cursor = None
+        self._chunks = []
+        self._pending_chunks = []
+        self.generated_time = None
+        self.generated_display = ""
+        self.sessions_count = 0
+        self.saved_overview_id = None
+        self.timestamp_label.setText("")
+        self.status_label.setText("")
+        self.progress_bar.hide()
+        self.generate_btn.setEnabled(True)
+        self.export_btn.setEnabled(False)
+
     def generate_overview(self):
         """Generate the AI overview of all consultations."""
+        if self.worker is not None and self.worker.isRunning():
+            return
         user = self.auth.get_current_user()
         if not user:
             QMessageBox.warning(self, "Error", "No user logged in.")
             return
 
-        # Get all sessions for the user
-        sessions = self.db.get_user_sessions(user.id)
-
-        if not sessions:
-            QMessageBox.information(
-                self,
-                "No Consultations",
-                "You don't have any consultations yet. Start a consultation first!"
-            )
-            return
-
-        # Store sessions count for saving
-        self.sessions_count = len(sessions)
-
-        # Gather all conversation data
-        conversations_text = self._gather_conversations(sessions)
-
-        if not conversations_text.strip():
-            QMessageBox.information(
-                self,
-                "No Conversation Data",
-                "Your consultations don't have any conversation data yet."
-            )
-            return
-
-        # Update UI for generating state
+        # Update UI for generating state; the worker loads the conversations
         self.generate_btn.setEnabled(False)
         self.export_btn.setEnabled(False)
         self.progress_bar.show()
-        self.status_label.setText("Analyzing your consultations...")
-        self.content_area.clear()
-        self.overview_content = ""
-
-        # Start worker thread
-        self.worker = OverviewWorker(self.ai, conversations_text)
-        self.worker.chunk_received.connect(self.on_chunk_received)
-        self.worker.finished.connect(self.on_generation_finished)
-        self.worker.error.connect(self.on_generation_error)
+        self.status_label.setStyleSheet(_OVERVIEW_STATUS_QSS["working"])
+        self.status_label.setText("Gathering your consultations...")
+        self._set_content("")
+        self._stream_cursor = None
+        self._chunks = []
+        self._pending_chunks = []
+
+        # Start worker thread; the worker (and its event loop) is reused
+        # for regenerations in this dialog
+        if self.worker is None:
+            self.worker = OverviewWorker(self.ai, self.db, user.id, self._gather_cache)
+            self.worker.gathered.connect(self.on_conversations_gathered)
+            self.worker.no_data.connect(self.on_no_conversation_data)
+            self.worker.chunk_received.connect(self.on_chunk_received)
+            self.worker.overview_finished.connect(self.on_generation_finished)
+            self.worker.error.connect(self.on_generation_error)
+            # Generate is re-enabled only once the thread has really exited,
+            # since start() is ignored while run() is still unwinding
+            self.worker.finished.connect(self._on_worker_stopped)
+        self.worker.user_id = user.id
         self.worker.start()
 
-    def _gather_conversations(self, sessions) -> str:
-        """Gather all conversation text from sessions."""
-        all_conversations = []
-
-        for session in sessions:
-            # Reload session to get conversation data
-            full_session = self.db.get_session_by_id(session.id)
-            if not full_session:
-                continue
-
-            conversation = full_session.conversation
-            if not conversation:
-                continue
-
-            session_text = f"\n--- Consultation: {full_session.title} ({full_session.template_type}) ---\n"
-            session_text += f"Created: {full_session.created_at.strftime('%Y-%m-%d')}\n\n"
-
-            for msg in conversation:
-                role = "Educator" if msg["role"] == "user" else "AI Consultant"
-                content = msg.get("content", "")
-                session_text += f"{role}: {content}\n\n"
+    @pyqtSlot(int)
+    def on_conversations_gathered(self, sessions_count: int):
+        """Record how many consultations are being analyzed."""
+        # Store sessions count for saving
+        self.sessions_count = sessions_count
+        self.status_label.setText(f"Analyzing {sessions_count} consultations...")
 
-            all_conversations.append(session_text)
+    @pyqtSlot(str, str)
+    def on_no_conversation_data(self, title: str, message: str):
+        """Return to the idle state when there is nothing to analyze."""
+        self.progress_bar.hide()
+        self.status_label.setText("")
+        QMessageBox.information(self, title, message)
+
+    @pyqtSlot()
+    def _on_worker_stopped(self):
+        """Allow another generation once the worker thread has exited."""
+        if self._export_worker is None:
+            self.generate_btn.setEnabled(True)
+
+    def done(self, result: int):
+        """Cancel an unfinished generation when the dialog closes."""
+        self._stream_flush_timer.stop()
+        if self.worker is not None:
+            # The worker's event loop is kept for the next opening
+            self.worker.stop()
+        super().done(result)
+
+    def shutdown(self):
+        """Stop the worker and close its event loop before the application exits."""
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker.close_loop()
+
+    def _set_content(self, text: str):
+        """Replace the whole document with painting and signals held until it is laid out."""
+        self.content_area.setUpdatesEnabled(False)
+        self.content_area.blockSignals(True)
+        try:
+            self.content_area.setPlainText(text)
+        finally:
+            self.content_area.blockSignals(False)
+            self.content_area.setUpdatesEnabled(True)
+        self.content_area.viewport().update()
 
-        return "\n".join(all_conversations)
+    @property
+    def overview_content(self) -> str:
+        """The overview text streamed so far."""
+        return "".join(self._chunks)
 
     @pyqtSlot(str)
     def on_chunk_received(self, chunk: str):
-        """Handle received chunk from AI."""
-        self.overview_content += chunk
-        self.content_area.setPlainText(self.overview_content)
-        # Scroll to bottom
-        scrollbar = self.content_area.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """Queue a received chunk; the flush timer writes it to the document."""
+        self._chunks.append(chunk)
+        self._pending_chunks.append(chunk)
+        if not self._stream_flush_timer.isActive():
+            self._stream_flush_timer.start()
+
+    def _flush_pending_chunks(self):
+        """Append the chunks queued since the last flush to the end of the document."""
+        self._stream_flush_timer.stop()
+        if not self._pending_chunks:
+            return
+        text = "".join(self._pending_chunks)
+        self._pending_chunks = []
+        if self._stream_cursor is None:
+            self._stream_cursor = QTextCursor(self.content_area.document())
+            self._stream_cursor.movePosition(QTextCursor.MoveOperation.End)
+        # Inserting keeps the stream cursor at the end of the document
+        self._stream_cursor.insertText(text)
+        # Handing it to the view scrolls to the bottom, once per flush
+        self.content_area.setTextCursor(self._stream_cursor)
 
     @pyqtSlot(str)
     def on_generation_finished(self, full_response: str):
         """Handle generation completion."""
+        self._flush_pending_chunks()
         self.progress_bar.hide()
-        self.generate_btn.setEnabled(True)
         self.export_btn.setEnabled(True)
         self.status_label.setText("Overview generated and saved!")
-        self.status_label.setStyleSheet(f"color: {COLORS['success']}; font-size: 13px;")
+        self.status_label.setStyleSheet(_OVERVIEW_STATUS_QSS["done"])
 
         # Set timestamp
         self.generated_time = datetime.now()
-        self.timestamp_label.setText(
-            f"Generated: {self.generated_time.strftime('%B %d, %Y at %I:%M %p')}"
-        )
+        # Formatted once for the label, the saved title and the export
+        self.generated_display = self.generated_time.strftime(_OVERVIEW_TIMESTAMP_FORMAT)
+        self.timestamp_label.setText(f"Generated: {self.generated_display}")
 
         # Save to database
         user = self.auth.get_current_user()
         if user:
-            title = f"Overview - {self.generated_time.strftime('%B %d, %Y at %I:%M %p')}"
+            title = f"Overview - {self.generated_display}"
             overview = self.db.create_overview(
                 user_id=user.id,
                 title=title,
@@ -332,10 +717,10 @@ class ConsultOverviewDialog(QDialog):
     @pyqtSlot(str)
     def on_generation_error(self, error_msg: str):
         """Handle generation error."""
+        self._flush_pending_chunks()
         self.progress_bar.hide()
-        self.generate_btn.setEnabled(True)
         self.status_label.setText(f"Error: {error_msg}")
-        self.status_label.setStyleSheet(f"color: {COLORS['error']}; font-size: 13px;")
+        self.status_label.setStyleSheet(_OVERVIEW_STATUS_QSS["error"])
 
         QMessageBox.warning(
             self,
@@ -350,35 +735,63 @@ class ConsultOverviewDialog(QDialog):
             QMessageBox.warning(self, "No Content", "Generate an overview first.")
             return
 
-        filepath, _ = QFileDialog.getSaveFileName(
+        _open_export_file_dialog(
             self,
-            "Export Overview",
             f"consultation_overview_{datetime.now().strftime('%Y%m%d')}.docx",
-            "Word Document (*.docx)"
+            self._on_export_path_chosen
         )
 
+    def _on_export_path_chosen(self, filepath: str):
+        """Start the background export to the chosen file."""
         if not filepath:
             return
 
         if not filepath.endswith(".docx"):
             filepath += ".docx"
 
-        try:
-            self._create_accessible_document(filepath)
+        # Build and save the document off the UI thread; generating again
+        # is blocked meanwhile so the content can't change under it
+        self.generate_btn.setEnabled(False)
+        self.export_btn.setEnabled(False)
+        self.progress_bar.show()
+        self.status_label.setStyleSheet(_OVERVIEW_STATUS_QSS["working"])
+        self.status_label.setText("Exporting document...")
+        # The worker gets a snapshot, not the dialog's live state
+        self._export_worker = DocxExportWorker(
+            partial(
+                self._create_accessible_document,
+                content=self.overview_content,
+                generated_display=self.generated_display
+            ),
+            filepath
+        )
+        self._export_worker.signals.done.connect(self.on_export_finished)
+        QThreadPool.globalInstance().start(self._export_worker)
+
+    @pyqtSlot(str, str)
+    def on_export_finished(self, filepath: str, error: str):
+        """Handle completion of a background export."""
+        self._export_worker = None
+        self.progress_bar.hide()
+        self.generate_btn.setEnabled(self.worker is None or not self.worker.isRunning())
+        self.export_btn.setEnabled(True)
+        self.status_label.setText("")
+
+        if not error:
             QMessageBox.information(
                 self,
                 "Export Successful",
                 f"Overview exported to:\n{filepath}"
             )
-        except Exception as e:
+        else:
             QMessageBox.warning(
                 self,
                 "Export Failed",
-                f"Failed to export: {str(e)}"
+                f"Failed to export: {error}"
             )
 
-    def _create_accessible_document(self, filepath: str):
-        """Create a WCAG-accessible Word document."""
+    def _create_accessible_document(self, filepath: str, content: str, generated_display: str):
+        """Create a WCAG-accessible Word document from an overview snapshot."""
         doc = Document()
 
         # Set document properties for accessibility
@@ -391,11 +804,11 @@ class ConsultOverviewDialog(QDialog):
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # Timestamp
-        if self.generated_time:
+        if generated_display:
             timestamp_para = doc.add_paragraph()
             timestamp_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
             run = timestamp_para.add_run(
-                f"Generated: {self.generated_time.strftime('%B %d, %Y at %I:%M %p')}"
+                f"Generated: {generated_display}"
             )
             run.font.size = Pt(11)
             run.font.color.rgb = RGBColor(128, 128, 128)
@@ -413,7 +826,7 @@ class ConsultOverviewDialog(QDialog):
         doc.add_paragraph()
 
         # Parse and add content with proper headings
-        self._parse_markdown_to_docx(doc, self.overview_content)
+        self._parse_markdown_to_docx(doc, content)
 
         # Add accessibility statement
         doc.add_page_break()
@@ -445,47 +858,27 @@ class ConsultOverviewDialog(QDialog):
         """Parse markdown-style text and add to document with proper formatting."""
         lines = markdown_text.split('\n')
         current_para = None
-        in_list = False
 
         for line in lines:
             line = line.strip()
 
             if not line:
                 current_para = None
-                in_list = False
                 continue
 
-            # Handle headings
-            if line.startswith('## '):
-                doc.add_heading(line[3:], level=1)
-                current_para = None
-                in_list = False
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], level=2)
-                current_para = None
-                in_list = False
-            elif line.startswith('# '):
-                doc.add_heading(line[2:], level=1)
-                current_para = None
-                in_list = False
-            # Handle bullet points
-            elif line.startswith('- ') or line.startswith('* '):
-                para = doc.add_paragraph(line[2:], style='List Bullet')
-                in_list = True
+            kind, level, text = _classify_markdown_line(line)
+            if kind == "heading":
+                doc.add_heading(text, level=level)
                 current_para = None
-            elif line.startswith('• '):
-                para = doc.add_paragraph(line[2:], style='List Bullet')
-                in_list = True
+            elif kind == "bullet":
+                doc.add_paragraph(text, style='List Bullet')
                 current_para = None
-            # Handle numbered lists
-            elif len(line) > 2 and line[0].isdigit() and line[1] in '.):':
-                para = doc.add_paragraph(line[2:].strip(), style='List Number')
-                in_list = True
+            elif kind == "numbered":
+                doc.add_paragraph(text, style='List Number')
                 current_para = None
-            # Handle bold text (simple)
-            elif line.startswith('**') and line.endswith('**'):
+            elif kind == "bold":
                 para = doc.add_paragraph()
-                run = para.add_run(line[2:-2])
+                run = para.add_run(text)
                 run.bold = True
                 current_para = None
             # Regular paragraph
@@ -497,6 +890,144 @@ class ConsultOverviewDialog(QDialog):
                     current_para.add_run(' ' + line)
 
 
+class NotesListModel(QAbstractListModel):
+    """Read-only list model over stored notes, newest first, exposed a page at a time."""
+
+    TimestampRole = Qt.ItemDataRole.UserRole + 1
+    PAGE_SIZE = 40
+
+    def __init__(self, notes: list, parent=None):
+        super().__init__(parent)
+        self._notes = list(reversed(notes))
+        self._loaded = min(len(self._notes), self.PAGE_SIZE)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of notes shown so far; the list is flat."""
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """Whether older notes remain to be shown."""
+        return not parent.isValid() and self._loaded < len(self._notes)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Show the next page of older notes; the view calls this as it scrolls to the end."""
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._notes) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Note text, display timestamp, or accessible summary for a row."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._notes[row]['content']
+        if role == self.TimestampRole:
+            return self._notes[row]['timestamp_display']
+        if role == Qt.ItemDataRole.AccessibleTextRole:
+            return f"{self._notes[row]['timestamp_display']}: {self._notes[row]['content']}"
+        return None
+
+
+class NoteDelegate(QStyledItemDelegate):
+    """Paint a note as a rounded box with its timestamp above the text."""
+
+    PADDING = 16
+    SPACING = 4
+    # Shared by every delegate; unlike fonts, QColor needs no QGuiApplication
+    BACKGROUND = QColor(COLORS['dark_input'])
+    MUTED = QColor(COLORS['text_muted'])
+    TEXT = QColor(COLORS['text'])
+
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self._view = view
+        self._time_font = QFont(view.font())
+        self._time_font.setPixelSize(11)
+        self._content_font = QFont(view.font())
+        self._content_font.setPixelSize(13)
+        # Font metrics are fixed for the delegate's lifetime
+        self._time_height = QFontMetrics(self._time_font).height()
+        self._content_metrics = QFontMetrics(self._content_font)
+        # Wrapped text heights for the current width; the view asks for
+        # size hints on every layout pass, not just when the width changes
+        self._heights: dict[str, int] = {}
+        self._heights_width = None
+
+    def _content_height(self, text: str, width: int) -> int:
+        """Height of the wrapped note text at the given width."""
+        if width != self._heights_width:
+            self._heights.clear()
+            self._heights_width = width
+        height = self._heights.get(text)
+        if height is None:
+            height = self._content_metrics.boundingRect(0, 0, width, 0, Qt.TextFlag.TextWordWrap, text).height()
+            self._heights[text] = height
+        return height
+
+    def sizeHint(self, option, index) -> QSize:
+        """Row height for the wrapped note at the current view width."""
+        width = self._view.viewport().width() - 2 * self.PADDING
+        content_height = self._content_height(index.data(), max(width, 1))
+        return QSize(width, self._time_height + self.SPACING + content_height + 2 * self.PADDING)
+
+    def paint(self, painter: QPainter, option, index):
+        """Draw the note box, timestamp and wrapped text."""
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.BACKGROUND)
+        painter.drawRoundedRect(QRectF(option.rect), 6, 6)
+
+        text_rect = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        time_height = self._time_height
+
+        painter.setFont(self._time_font)
+        painter.setPen(self.MUTED)
+        painter.drawText(
+            text_rect.adjusted(0, 0, 0, time_height - text_rect.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+            index.data(NotesListModel.TimestampRole)
+        )
+
+        painter.setFont(self._content_font)
+        painter.setPen(self.TEXT)
+        painter.drawText(
+            text_rect.adjusted(0, time_height + self.SPACING, 0, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            index.data()
+        )
+        painter.restore()
+
+
+def _build_notes_view(notes: list) -> QWidget:
+    """Notes list for the notes dialogs, or an empty-state label."""
+    if not notes:
+        empty_label = QLabel("No notes yet. Add your first note below!")
+        empty_label.setStyleSheet(_NOTES_EMPTY_QSS)
+        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        return empty_label
+
+    view = QListView()
+    view.setStyleSheet(_NOTES_LIST_QSS)
+    view.setMaximumHeight(200)
+    view.setSpacing(4)
+    view.setWordWrap(True)
+    view.setResizeMode(QListView.ResizeMode.Adjust)
+    view.setSelectionMode(QListView.SelectionMode.NoSelection)
+    view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+    view.setAccessibleName("Previous notes")
+    view.setModel(NotesListModel(notes, view))
+    view.setItemDelegate(NoteDelegate(view))
+    return view
+
+
 class NotesDialog(QDialog):
     """Dialog for viewing and adding notes to a session."""
 
@@ -513,25 +1044,7 @@ class NotesDialog(QDialog):
 
     def setup_ui(self):
         """Set up the notes dialog UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-            }}
-            QTextEdit {{
-                background-color: {COLORS['dark_input']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 14px;
-            }}
-            QTextEdit:focus {{
-                border: 1px solid {COLORS['primary']};
-            }}
-        """)
+        self.setStyleSheet(_NOTES_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -539,71 +1052,21 @@ class NotesDialog(QDialog):
 
         # Title
         title = QLabel("Session Notes")
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(shared_font(20, bold=True))
         layout.addWidget(title)
 
         # Existing notes section
         notes_label = QLabel("Previous Notes")
-        notes_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        notes_label.setFont(shared_font(14, bold=True))
         layout.addWidget(notes_label)
 
-        # Notes scroll area
-        notes_scroll = QScrollArea()
-        notes_scroll.setWidgetResizable(True)
-        notes_scroll.setMaximumHeight(200)
-        notes_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                background-color: {COLORS['dark_bg']};
-            }}
-        """)
-
-        notes_container = QWidget()
-        notes_layout = QVBoxLayout(notes_container)
-        notes_layout.setSpacing(8)
-        notes_layout.setContentsMargins(8, 8, 8, 8)
-
-        if self.notes:
-            for note in reversed(self.notes):  # Show newest first
-                note_frame = QFrame()
-                note_frame.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {COLORS['dark_input']};
-                        border-radius: 6px;
-                        padding: 8px;
-                    }}
-                """)
-                note_layout = QVBoxLayout(note_frame)
-                note_layout.setSpacing(4)
-                note_layout.setContentsMargins(8, 8, 8, 8)
-
-                # Timestamp
-                timestamp = datetime.fromisoformat(note['timestamp'])
-                time_label = QLabel(timestamp.strftime("%b %d, %Y at %I:%M %p"))
-                time_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
-                note_layout.addWidget(time_label)
-
-                # Content
-                content_label = QLabel(note['content'])
-                content_label.setWordWrap(True)
-                content_label.setStyleSheet(f"color: {COLORS['text']}; font-size: 13px;")
-                note_layout.addWidget(content_label)
-
-                notes_layout.addWidget(note_frame)
-        else:
-            empty_label = QLabel("No notes yet. Add your first note below!")
-            empty_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-style: italic;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            notes_layout.addWidget(empty_label)
-
-        notes_layout.addStretch()
-        notes_scroll.setWidget(notes_container)
-        layout.addWidget(notes_scroll)
+        # Notes list; rows are painted by NoteDelegate rather than built
+        # from a frame and two labels per note
+        layout.addWidget(_build_notes_view(self.notes))
 
         # Add new note section
         new_note_label = QLabel("Add New Note")
-        new_note_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        new_note_label.setFont(shared_font(14, bold=True))
         layout.addWidget(new_note_label)
 
         self.note_input = QTextEdit()
@@ -660,25 +1123,7 @@ class OverviewNotesDialog(QDialog):
 
     def setup_ui(self):
         """Set up the notes dialog UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-            }}
-            QTextEdit {{
-                background-color: {COLORS['dark_input']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 14px;
-            }}
-            QTextEdit:focus {{
-                border: 1px solid {COLORS['primary']};
-            }}
-        """)
+        self.setStyleSheet(_NOTES_DIALOG_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -686,69 +1131,21 @@ class OverviewNotesDialog(QDialog):
 
         # Title
         title = QLabel("Overview Notes")
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(shared_font(20, bold=True))
         layout.addWidget(title)
 
         # Existing notes section
         notes_label = QLabel("Previous Notes")
-        notes_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        notes_label.setFont(shared_font(14, bold=True))
         layout.addWidget(notes_label)
 
-        # Notes scroll area
-        notes_scroll = QScrollArea()
-        notes_scroll.setWidgetResizable(True)
-        notes_scroll.setMaximumHeight(200)
-        notes_scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                background-color: {COLORS['dark_bg']};
-            }}
-        """)
-
-        notes_container = QWidget()
-        notes_layout = QVBoxLayout(notes_container)
-        notes_layout.setSpacing(8)
-        notes_layout.setContentsMargins(8, 8, 8, 8)
-
-        if self.notes:
-            for note in reversed(self.notes):
-                note_frame = QFrame()
-                note_frame.setStyleSheet(f"""
-                    QFrame {{
-                        background-color: {COLORS['dark_input']};
-                        border-radius: 6px;
-                        padding: 8px;
-                    }}
-                """)
-                note_layout_inner = QVBoxLayout(note_frame)
-                note_layout_inner.setSpacing(4)
-                note_layout_inner.setContentsMargins(8, 8, 8, 8)
-
-                timestamp = datetime.fromisoformat(note['timestamp'])
-                time_label = QLabel(timestamp.strftime("%b %d, %Y at %I:%M %p"))
-                time_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
-                note_layout_inner.addWidget(time_label)
-
-                content_label = QLabel(note['content'])
-                content_label.setWordWrap(True)
-                content_label.setStyleSheet(f"color: {COLORS['text']}; font-size: 13px;")
-                note_layout_inner.addWidget(content_label)
-
-                notes_layout.addWidget(note_frame)
-        else:
-            empty_label = QLabel("No notes yet. Add your first note below!")
-            empty_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-style: italic;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            notes_layout.addWidget(empty_label)
-
-        notes_layout.addStretch()
-        notes_scroll.setWidget(notes_container)
-        layout.addWidget(notes_scroll)
+        # Notes list; rows are painted by NoteDelegate rather than built
+        # from a frame and two labels per note
+        layout.addWidget(_build_notes_view(self.notes))
 
         # Add new note section
         new_note_label = QLabel("Add New Note")
-        new_note_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        new_note_label.setFont(shared_font(14, bold=True))
         layout.addWidget(new_note_label)
 
         self.note_input = QTextEdit()
@@ -795,6 +1192,7 @@ class ViewOverviewDialog(QDialog):
     def __init__(self, overview: ConsultOverview, parent=None):
         super().__init__(parent)
         self.overview = overview
+        self._export_worker = None
         self.setWindowTitle(overview.title)
         self.setModal(True)
         self.setMinimumSize(700, 550)
@@ -802,22 +1200,7 @@ class ViewOverviewDialog(QDialog):
 
     def setup_ui(self):
         """Set up the view dialog UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-            }}
-            QTextEdit {{
-                background-color: {COLORS['dark_input']};
-                color: {COLORS['text']};
-                border: 1px solid {COLORS['dark_input']};
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 14px;
-            }}
-        """)
+        self.setStyleSheet(_VIEW_OVERVIEW_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -827,7 +1210,7 @@ class ViewOverviewDialog(QDialog):
         header_layout = QHBoxLayout()
 
         title = QLabel(self.overview.title)
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(shared_font(20, bold=True))
         header_layout.addWidget(title)
 
         header_layout.addStretch()
@@ -835,11 +1218,11 @@ class ViewOverviewDialog(QDialog):
         # Metadata
         meta_layout = QVBoxLayout()
         created_label = QLabel(f"Created: {self.overview.created_at.strftime('%B %d, %Y at %I:%M %p')}")
-        created_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
+        created_label.setStyleSheet(_CAPTION_QSS)
         meta_layout.addWidget(created_label)
 
         sessions_label = QLabel(f"Sessions analyzed: {self.overview.sessions_analyzed}")
-        sessions_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 11px;")
+        sessions_label.setStyleSheet(_CAPTION_QSS)
         meta_layout.addWidget(sessions_label)
 
         header_layout.addLayout(meta_layout)
@@ -855,11 +1238,11 @@ class ViewOverviewDialog(QDialog):
         btn_layout = QHBoxLayout()
         btn_layout.setSpacing(12)
 
-        export_btn = QPushButton("Export Document")
-        export_btn.setProperty("class", "secondary")
-        export_btn.clicked.connect(self.export_overview)
-        export_btn.setMinimumHeight(44)
-        btn_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export Document")
+        self.export_btn.setProperty("class", "secondary")
+        self.export_btn.clicked.connect(self.export_overview)
+        self.export_btn.setMinimumHeight(44)
+        btn_layout.addWidget(self.export_btn)
 
         btn_layout.addStretch()
 
@@ -873,24 +1256,34 @@ class ViewOverviewDialog(QDialog):
 
     def export_overview(self):
         """Export the overview to a Word document."""
-        filepath, _ = QFileDialog.getSaveFileName(
+        _open_export_file_dialog(
             self,
-            "Export Overview",
             f"overview_{self.overview.created_at.strftime('%Y%m%d_%H%M')}.docx",
-            "Word Document (*.docx)"
+            self._on_export_path_chosen
         )
 
+    def _on_export_path_chosen(self, filepath: str):
+        """Start the background export to the chosen file."""
         if not filepath:
             return
 
         if not filepath.endswith(".docx"):
             filepath += ".docx"
 
-        try:
-            self._create_document(filepath)
+        self.export_btn.setEnabled(False)
+        self._export_worker = DocxExportWorker(self._create_document, filepath)
+        self._export_worker.signals.done.connect(self.on_export_finished)
+        QThreadPool.globalInstance().start(self._export_worker)
+
+    @pyqtSlot(str, str)
+    def on_export_finished(self, filepath: str, error: str):
+        """Handle completion of a background export."""
+        self._export_worker = None
+        self.export_btn.setEnabled(True)
+        if not error:
             QMessageBox.information(self, "Export Successful", f"Overview exported to:\n{filepath}")
-        except Exception as e:
-            QMessageBox.warning(self, "Export Failed", f"Failed to export: {str(e)}")
+        else:
+            QMessageBox.warning(self, "Export Failed", f"Failed to export: {error}")
 
     def _create_document(self, filepath: str):
         """Create a WCAG-accessible Word document."""
@@ -917,22 +1310,23 @@ class ViewOverviewDialog(QDialog):
             line = line.strip()
             if not line:
                 continue
-            if line.startswith('## '):
-                doc.add_heading(line[3:], level=1)
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], level=2)
-            elif line.startswith('# '):
-                doc.add_heading(line[2:], level=1)
-            elif line.startswith('- ') or line.startswith('* '):
-                doc.add_paragraph(line[2:], style='List Bullet')
-            elif line.startswith('• '):
-                doc.add_paragraph(line[2:], style='List Bullet')
+            kind, level, text = _classify_markdown_line(line)
+            if kind == "heading":
+                doc.add_heading(text, level=level)
+            elif kind == "bullet":
+                doc.add_paragraph(text, style='List Bullet')
             else:
                 doc.add_paragraph(line)
 
         doc.save(filepath)
 
 
+# Card grids are GRID_COLUMNS equal columns of cards at least CARD_MIN_WIDTH wide
+GRID_COLUMNS = 3
+CARD_MIN_WIDTH = 250
+GRID_SPACING = 20
+
+
 class OverviewCard(QFrame):
     """Card widget for displaying a saved overview."""
 
@@ -941,172 +1335,174 @@ class OverviewCard(QFrame):
     notes_requested = pyqtSignal(int, str)
     title_changed = pyqtSignal(int, str)
 
-    def __init__(self, overview: ConsultOverview):
+    def __init__(self, overview: OverviewDisplayRow):
         super().__init__()
-        self.overview_id = overview.id
-        self.overview_title = overview.title
-        self.original_title = overview.title
-        self.setup_ui(overview)
+        self.setup_ui()
+        self.update_from(overview)
         self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
-    def setup_ui(self, overview: ConsultOverview):
+    def setup_ui(self):
         """Set up the card UI."""
-        colors = get_colors()
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['dark_card']};
-                border: 1px solid {colors.get('dark_border', '#1c2a4a')};
-                border-radius: 12px;
-                padding: 20px;
-                border-left: 4px solid {colors['secondary']};
-            }}
-            QFrame:hover {{
-                background-color: {colors.get('dark_hover', '#1a2d50')};
-            }}
-        """)
-        self.setMinimumWidth(250)
+        self.setProperty("class", "overview-card")
+        self.setMinimumWidth(CARD_MIN_WIDTH)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Content area
-        content_widget = QWidget()
-        content_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(10)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-
         # Editable Title
-        self.title_input = QLineEdit(overview.title)
-        self.title_input.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.title_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {colors['dark_input']};
-                color: {colors['text']};
-                border: 1px solid {colors['dark_input']};
-                border-radius: 6px;
-                padding: 6px 8px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {colors['primary']};
-            }}
-        """)
+        self.title_input = QLineEdit()
+        self.title_input.setFont(shared_font(14, bold=True))
         self.title_input.setAccessibleName("Edit overview title")
         self.title_input.editingFinished.connect(self.on_title_changed)
-        content_layout.addWidget(self.title_input)
+        layout.addWidget(self.title_input)
 
         # Type badge
         type_label = QLabel("Overview Report")
-        type_label.setStyleSheet(f"""
-            background-color: {colors['secondary']};
-            color: {colors['text']};
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 11px;
-        """)
+        type_label.setProperty("class", "card-badge")
         type_label.setMaximumWidth(120)
         type_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-        content_layout.addWidget(type_label)
+        layout.addWidget(type_label)
 
         # Sessions analyzed
-        sessions_label = QLabel(f"Sessions analyzed: {overview.sessions_analyzed}")
-        sessions_label.setStyleSheet(f"color: {colors['text_muted']}; font-size: 12px;")
-        content_layout.addWidget(sessions_label)
+        self.sessions_label = QLabel()
+        self.sessions_label.setProperty("class", "card-meta")
+        layout.addWidget(self.sessions_label)
 
         # Created date
-        created_label = QLabel(f"Created: {overview.created_at.strftime('%b %d, %Y at %I:%M %p')}")
-        created_label.setStyleSheet(f"color: {colors['text_muted']}; font-size: 11px;")
-        content_layout.addWidget(created_label)
+        self.created_label = QLabel()
+        self.created_label.setProperty("class", "card-caption")
+        layout.addWidget(self.created_label)
 
-        layout.addWidget(content_widget)
         layout.addStretch(1)
 
         # Actions row
-        actions_widget = QWidget()
-        actions_widget.setMinimumHeight(48)
-        actions_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        actions = QHBoxLayout(actions_widget)
+        actions = QHBoxLayout()
         actions.setSpacing(6)
         actions.setContentsMargins(0, 4, 0, 0)
 
         # Open button
-        open_btn = QPushButton("Open")
-        open_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['success']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: #27ae60;
-            }}
-        """)
-        open_btn.setMinimumHeight(44)
-        open_btn.clicked.connect(lambda: self.open_requested.emit(self.overview_id))
-        open_btn.setAccessibleName(f"Open {overview.title}")
-        actions.addWidget(open_btn)
+        self.open_btn = QPushButton("Open")
+        self.open_btn.setProperty("class", "card-open")
+        self.open_btn.setMinimumHeight(44)
+        self.open_btn.clicked.connect(self._on_open_clicked)
+        actions.addWidget(self.open_btn)
 
         # Notes button
-        notes_btn = QPushButton("Notes")
-        notes_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['primary']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: #5849c4;
-            }}
-        """)
-        notes_btn.setMinimumHeight(44)
-        notes_btn.clicked.connect(lambda: self.notes_requested.emit(self.overview_id, self.overview_title))
-        notes_btn.setAccessibleName(f"Notes for {overview.title}")
-        actions.addWidget(notes_btn)
+        self.notes_btn = QPushButton("Notes")
+        self.notes_btn.setProperty("class", "card-notes")
+        self.notes_btn.setMinimumHeight(44)
+        self.notes_btn.clicked.connect(self._on_notes_clicked)
+        actions.addWidget(self.notes_btn)
 
         actions.addStretch()
 
         # Delete button
-        delete_btn = QPushButton("Delete")
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {colors['error']};
-                border: 1px solid {colors['error']};
-                border-radius: 8px;
-                padding: 4px 8px;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['error']};
-                color: white;
-            }}
-        """)
-        delete_btn.setMinimumHeight(44)
-        delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.overview_id))
-        delete_btn.setAccessibleName(f"Delete {overview.title}")
-        actions.addWidget(delete_btn)
-
-        layout.addWidget(actions_widget)
-
-        self.setAccessibleName(f"{overview.title}. Overview Report. {overview.sessions_analyzed} sessions analyzed.")
+        self.delete_btn = QPushButton("Delete")
+        self.delete_btn.setProperty("class", "card-delete")
+        self.delete_btn.setMinimumHeight(44)
+        self.delete_btn.clicked.connect(self._on_delete_clicked)
+        actions.addWidget(self.delete_btn)
+
+        layout.addLayout(actions)
 
+    def update_from(self, overview: OverviewDisplayRow):
+        """Show another overview in this card without rebuilding it."""
+        self.row = overview
+        self.overview_id = overview.id
+        self.overview_title = overview.title
+        self.original_title = overview.title
+        self.title_input.setText(overview.title)
+        self.sessions_label.setText(f"Sessions analyzed: {overview.sessions_analyzed}")
+        self.created_label.setText(f"Created: {_format_card_timestamp(overview.created_at)}")
+        self._set_accessible_names(overview.title)
+
+    def _set_accessible_names(self, title: str):
+        """Name the card and its buttons after the overview title."""
+        self.open_btn.setAccessibleName(f"Open {title}")
+        self.notes_btn.setAccessibleName(f"Notes for {title}")
+        self.delete_btn.setAccessibleName(f"Delete {title}")
+        self.setAccessibleName(f"{title}. Overview Report. {self.row.sessions_analyzed} sessions analyzed.")
+
+    @pyqtSlot()
+    def _on_open_clicked(self):
+        """Request that this card's item be opened."""
+        self.open_requested.emit(self.overview_id)
+
+    @pyqtSlot()
+    def _on_notes_clicked(self):
+        """Request the notes dialog for this card's item."""
+        self.notes_requested.emit(self.overview_id, self.overview_title)
+
+    @pyqtSlot()
+    def _on_delete_clicked(self):
+        """Request deletion of this card's item."""
+        self.delete_requested.emit(self.overview_id)
+
+    @pyqtSlot()
     def on_title_changed(self):
         """Handle title edit completion."""
         new_title = self.title_input.text().strip()
-        if new_title and new_title != self.original_title:
+        if not new_title:
+            # A cleared title is not saved; show the current one again
+            self.title_input.setText(self.original_title)
+        elif new_title != self.original_title:
             self.title_changed.emit(self.overview_id, new_title)
             self.original_title = new_title
             self.overview_title = new_title
+            self._set_accessible_names(new_title)
+
+
+# (title, content) for each tutorial page
+_TUTORIAL_STEPS: tuple[tuple[str, str], ...] = (
+    (
+        "Welcome to Inclusive Design Wizard!",
+        "This tutorial will guide you through the main features of the dashboard.\n\n"
+        "The Inclusive Design Wizard helps educators create accessible learning "
+        "experiences using UDL (Universal Design for Learning) and WCAG "
+        "(Web Content Accessibility Guidelines) frameworks.\n\n"
+        "Click 'Next' to continue."
+    ),
+    (
+        "Starting a New Consultation",
+        "Click the 'Start New Consultation' button to begin a new accessibility review.\n\n"
+        "You'll be asked to:\n"
+        "  1. Give your consultation a name\n"
+        "  2. Select the type of consultation\n\n"
+        "The AI assistant will then guide you through a series of questions "
+        "to help identify accessibility improvements for your learning materials."
+    ),
+    (
+        "Recent Consultations",
+        "Your previous consultations appear in the 'Recent Consultations' section.\n\n"
+        "Each card shows:\n"
+        "  - The consultation title (click to edit)\n"
+        "  - The consultation type\n"
+        "  - Current status (In Progress or Complete)\n"
+        "  - Last modified date\n\n"
+        "Click 'Open' to continue a consultation, or 'Delete' to remove it."
+    ),
+    (
+        "Settings",
+        "Click the 'Settings' button to configure your AI provider.\n\n"
+        "You can choose between:\n"
+        "  - Local AI (Ollama, LM Studio) - runs on your computer, more private\n"
+        "  - Cloud AI (OpenAI, Anthropic) - requires API key, more powerful\n\n"
+        "Use 'Test Connection' to verify your AI is working before starting."
+    ),
+    (
+        "You're Ready!",
+        "That's everything you need to get started!\n\n"
+        "Tips for best results:\n"
+        "  - Be specific about your learning context\n"
+        "  - Describe your learners' needs\n"
+        "  - Ask follow-up questions if needed\n\n"
+        "The AI will provide recommendations based on UDL principles and "
+        "WCAG guidelines to help make your content more accessible.\n\n"
+        "Click 'Finish' to close this tutorial."
+    ),
+)
 
 
 class TutorialDialog(QDialog):
@@ -1118,76 +1514,12 @@ class TutorialDialog(QDialog):
         self.setModal(True)
         self.setMinimumSize(500, 400)
         self.current_step = 0
-        self.steps = [
-            {
-                "title": "Welcome to Inclusive Design Wizard!",
-                "content": (
-                    "This tutorial will guide you through the main features of the dashboard.\n\n"
-                    "The Inclusive Design Wizard helps educators create accessible learning "
-                    "experiences using UDL (Universal Design for Learning) and WCAG "
-                    "(Web Content Accessibility Guidelines) frameworks.\n\n"
-                    "Click 'Next' to continue."
-                )
-            },
-            {
-                "title": "Starting a New Consultation",
-                "content": (
-                    "Click the 'Start New Consultation' button to begin a new accessibility review.\n\n"
-                    "You'll be asked to:\n"
-                    "  1. Give your consultation a name\n"
-                    "  2. Select the type of consultation\n\n"
-                    "The AI assistant will then guide you through a series of questions "
-                    "to help identify accessibility improvements for your learning materials."
-                )
-            },
-            {
-                "title": "Recent Consultations",
-                "content": (
-                    "Your previous consultations appear in the 'Recent Consultations' section.\n\n"
-                    "Each card shows:\n"
-                    "  - The consultation title (click to edit)\n"
-                    "  - The consultation type\n"
-                    "  - Current status (In Progress or Complete)\n"
-                    "  - Last modified date\n\n"
-                    "Click 'Open' to continue a consultation, or 'Delete' to remove it."
-                )
-            },
-            {
-                "title": "Settings",
-                "content": (
-                    "Click the 'Settings' button to configure your AI provider.\n\n"
-                    "You can choose between:\n"
-                    "  - Local AI (Ollama, LM Studio) - runs on your computer, more private\n"
-                    "  - Cloud AI (OpenAI, Anthropic) - requires API key, more powerful\n\n"
-                    "Use 'Test Connection' to verify your AI is working before starting."
-                )
-            },
-            {
-                "title": "You're Ready!",
-                "content": (
-                    "That's everything you need to get started!\n\n"
-                    "Tips for best results:\n"
-                    "  - Be specific about your learning context\n"
-                    "  - Describe your learners' needs\n"
-                    "  - Ask follow-up questions if needed\n\n"
-                    "The AI will provide recommendations based on UDL principles and "
-                    "WCAG guidelines to help make your content more accessible.\n\n"
-                    "Click 'Finish' to close this tutorial."
-                )
-            }
-        ]
+        self.steps = _TUTORIAL_STEPS
         self.setup_ui()
 
     def setup_ui(self):
         """Set up the tutorial UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-            QLabel {{
-                color: {COLORS['text']};
-            }}
-        """)
+        self.setStyleSheet(_TUTORIAL_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)
@@ -1195,20 +1527,20 @@ class TutorialDialog(QDialog):
 
         # Step indicator
         self.step_indicator = QLabel()
-        self.step_indicator.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 12px;")
+        self.step_indicator.setStyleSheet(_SMALL_CAPTION_QSS)
         layout.addWidget(self.step_indicator)
 
         # Title
         self.title_label = QLabel()
-        self.title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        self.title_label.setFont(shared_font(20, bold=True))
         self.title_label.setWordWrap(True)
         layout.addWidget(self.title_label)
 
         # Content
         self.content_label = QLabel()
-        self.content_label.setFont(QFont("Arial", 14))
+        self.content_label.setFont(shared_font(14))
         self.content_label.setWordWrap(True)
-        self.content_label.setStyleSheet(f"color: {COLORS['text']}; line-height: 1.5;")
+        self.content_label.setStyleSheet(_TUTORIAL_CONTENT_QSS)
         self.content_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         layout.addWidget(self.content_label, 1)
 
@@ -1242,10 +1574,10 @@ class TutorialDialog(QDialog):
 
     def update_content(self):
         """Update the dialog content for current step."""
-        step = self.steps[self.current_step]
+        title, content = self.steps[self.current_step]
         self.step_indicator.setText(f"Step {self.current_step + 1} of {len(self.steps)}")
-        self.title_label.setText(step["title"])
-        self.content_label.setText(step["content"])
+        self.title_label.setText(title)
+        self.content_label.setText(content)
 
         # Update button states
         self.prev_btn.setEnabled(self.current_step > 0)
@@ -1255,6 +1587,12 @@ class TutorialDialog(QDialog):
         else:
             self.next_btn.setText("Next")
 
+    def restart(self):
+        """Return to the first step, e.g. before the dialog is shown again."""
+        if self.current_step != 0:
+            self.current_step = 0
+            self.update_content()
+
     def next_step(self):
         """Go to next step or finish."""
         if self.current_step < len(self.steps) - 1:
@@ -1270,6 +1608,123 @@ class TutorialDialog(QDialog):
             self.update_content()
 
 
+class ElidedLabel(QLabel):
+    """Single-line label that elides its text instead of wrapping."""
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._full_text = ""
+        # Width comes from the layout; the elided text never drives it
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        self.setText(text)
+
+    def setText(self, text: str):
+        """Set the full text; what is shown is elided to the label width."""
+        self._full_text = text
+        self.setAccessibleName(text)
+        self.setToolTip(text)
+        self._elide()
+
+    def resizeEvent(self, event):
+        """Re-elide for the new width."""
+        super().resizeEvent(event)
+        self._elide()
+
+    def _elide(self):
+        """Show as much of the full text as fits on one line."""
+        width = self.contentsRect().width()
+        super().setText(self.fontMetrics().elidedText(self._full_text, Qt.TextElideMode.ElideRight, width))
+
+
+class SessionsLoaderSignals(QObject):
+    """Signals emitted by SessionsLoader."""
+
+    done = pyqtSignal(int, list)  # generation, session display rows
+
+
+class SessionsLoader(QRunnable):
+    """Thread-pool task that fetches the dashboard's session rows."""
+
+    LIMIT = 12
+
+    def __init__(self, db_manager: DatabaseManager, user_id: int, generation: int):
+        super().__init__()
+        self.db = db_manager
+        self.user_id = user_id
+        self.generation = generation
+        self.signals = SessionsLoaderSignals()
+
+    def run(self):
+        """Run the query; each DatabaseManager call opens its own DB session."""
+        try:
+            rows = self.db.get_user_session_display_rows(self.user_id, limit=self.LIMIT)
+        except Exception as e:
+            print(f"Error loading sessions: {e}")
+            rows = []
+        self.signals.done.emit(self.generation, rows)
+
+
+class Toast(QLabel):
+    """Transient message shown over the bottom of its parent, hidden after a delay."""
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setStyleSheet(_TOAST_QSS)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._hide_timer = QTimer(self)
+        self._hide_timer.setSingleShot(True)
+        self._hide_timer.timeout.connect(self.hide)
+        self.hide()
+
+    def show_message(self, text: str, msecs: int = 2500):
+        """Show text for msecs, restarting the timer if already visible."""
+        self.setText(text)
+        self.setAccessibleName(text)
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move((parent.width() - self.width()) // 2, parent.height() - self.height() - 32)
+        self.raise_()
+        self.show()
+        self._hide_timer.start(msecs)
+
+
+class DbTaskSignals(QObject):
+    """Signals emitted by DbTask."""
+
+    finished = pyqtSignal(object)  # return value of the call, None on error
+
+
+class DbTask(QRunnable):
+    """Thread-pool task that runs a single DatabaseManager call."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DbTaskSignals()
+
+    def run(self):
+        """Run the call; each DatabaseManager method opens its own DB session."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"Database error in {self.fn.__name__}: {e}")
+            result = None
+        self.signals.finished.emit(result)
+
+
+# (name, key) pairs for the consultation type combo, in display order
+_CONSULTATION_ITEMS = tuple((value["name"], key) for key, value in CONSULTATION_TYPES.items())
+# Consultation type key -> (display name, short description)
+_TYPE_INFO = {
+    key: (value.get("name", "Custom"), value.get("short_description", ""))
+    for key, value in CONSULTATION_TYPES.items()
+}
+_UNKNOWN_TYPE_INFO = ("Custom", "")
+
+
 class SessionCard(QFrame):
     """Card widget for displaying a session."""
 
@@ -1278,180 +1733,132 @@ class SessionCard(QFrame):
     title_changed = pyqtSignal(int, str)
     notes_requested = pyqtSignal(int, str)  # session_id, session_title
 
-    def __init__(self, session: Session):
+    def __init__(self, session: SessionDisplayRow):
         super().__init__()
-        self.session_id = session.id
-        self.session_title = session.title or "Untitled Consultation"
-        self.original_title = self.session_title
-        self.setup_ui(session)
+        self.setup_ui()
+        self.update_from(session)
         self.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
-    def setup_ui(self, session: Session):
+    def setup_ui(self):
         """Set up the card UI."""
-        colors = get_colors()
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['dark_card']};
-                border: 1px solid {colors.get('dark_border', '#1c2a4a')};
-                border-radius: 12px;
-                padding: 20px;
-            }}
-            QFrame:hover {{
-                background-color: {colors.get('dark_hover', '#1a2d50')};
-            }}
-        """)
-        self.setMinimumWidth(250)
+        self.setProperty("class", "session-card")
+        self.setMinimumWidth(CARD_MIN_WIDTH)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        # Content area - holds all text elements
-        content_widget = QWidget()
-        content_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setSpacing(10)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-
         # Editable Title
-        self.title_input = QLineEdit(session.title or "Untitled Consultation")
-        self.title_input.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.title_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {colors['dark_input']};
-                color: {colors['text']};
-                border: 1px solid {colors['dark_input']};
-                border-radius: 6px;
-                padding: 6px 8px;
-            }}
-            QLineEdit:focus {{
-                border: 1px solid {colors['primary']};
-            }}
-        """)
+        self.title_input = QLineEdit()
+        self.title_input.setFont(shared_font(14, bold=True))
         self.title_input.setAccessibleName("Edit consultation title")
         self.title_input.editingFinished.connect(self.on_title_changed)
-        content_layout.addWidget(self.title_input)
+        layout.addWidget(self.title_input)
 
         # Type badge
-        type_name = CONSULTATION_TYPES.get(session.template_type, {}).get("name", "Custom")
-        type_label = QLabel(type_name)
-        type_label.setStyleSheet(f"""
-            background-color: {colors['secondary']};
-            color: {colors['text']};
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-size: 11px;
-        """)
-        type_label.setMaximumWidth(120)
-        type_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
-        content_layout.addWidget(type_label)
+        self.type_label = QLabel()
+        self.type_label.setProperty("class", "card-badge")
+        self.type_label.setMaximumWidth(120)
+        self.type_label.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        layout.addWidget(self.type_label)
 
         # Status
-        status_text = "Complete" if session.completed else f"In Progress - {session.current_phase}"
-        status = QLabel(status_text)
-        status.setStyleSheet(f"color: {colors['text_muted']}; font-size: 12px;")
-        status.setWordWrap(True)
-        content_layout.addWidget(status)
+        self.status_label = ElidedLabel()
+        self.status_label.setProperty("class", "card-meta")
+        layout.addWidget(self.status_label)
 
         # Last modified
-        if session.updated_at:
-            modified = session.updated_at.strftime("%b %d, %Y at %I:%M %p")
-        else:
-            modified = "Unknown"
-        modified_label = QLabel(f"Last modified: {modified}")
-        modified_label.setStyleSheet(f"color: {colors['text_muted']}; font-size: 11px;")
-        modified_label.setWordWrap(True)
-        content_layout.addWidget(modified_label)
-
-        layout.addWidget(content_widget)
+        self.modified_label = ElidedLabel()
+        self.modified_label.setProperty("class", "card-caption")
+        layout.addWidget(self.modified_label)
 
         # Spacer to push buttons to bottom
         layout.addStretch(1)
 
         # Actions row
-        actions_widget = QWidget()
-        actions_widget.setMinimumHeight(48)
-        actions_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        actions = QHBoxLayout(actions_widget)
+        actions = QHBoxLayout()
         actions.setSpacing(6)
         actions.setContentsMargins(0, 4, 0, 0)
 
         # Open button (green)
-        open_btn = QPushButton("Open")
-        open_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['success']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: #27ae60;
-            }}
-        """)
-        open_btn.setMinimumHeight(44)
-        open_btn.clicked.connect(lambda: self.open_requested.emit(self.session_id))
-        open_btn.setAccessibleName(f"Open {session.title}")
-        actions.addWidget(open_btn)
+        self.open_btn = QPushButton("Open")
+        self.open_btn.setProperty("class", "card-open")
+        self.open_btn.setMinimumHeight(44)
+        self.open_btn.clicked.connect(self._on_open_clicked)
+        actions.addWidget(self.open_btn)
 
         # Notes button
-        notes_btn = QPushButton("Notes")
-        notes_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['primary']};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 4px 12px;
-                font-weight: bold;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: #5849c4;
-            }}
-        """)
-        notes_btn.setMinimumHeight(44)
-        notes_btn.clicked.connect(lambda: self.notes_requested.emit(self.session_id, self.session_title))
-        notes_btn.setAccessibleName(f"Notes for {session.title}")
-        actions.addWidget(notes_btn)
+        self.notes_btn = QPushButton("Notes")
+        self.notes_btn.setProperty("class", "card-notes")
+        self.notes_btn.setMinimumHeight(44)
+        self.notes_btn.clicked.connect(self._on_notes_clicked)
+        actions.addWidget(self.notes_btn)
 
         actions.addStretch()
 
         # Delete button
-        delete_btn = QPushButton("Delete")
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {colors['error']};
-                border: 1px solid {colors['error']};
-                border-radius: 8px;
-                padding: 4px 8px;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['error']};
-                color: white;
-            }}
-        """)
-        delete_btn.setMinimumHeight(44)
-        delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.session_id))
-        delete_btn.setAccessibleName(f"Delete {session.title}")
-        actions.addWidget(delete_btn)
-
-        layout.addWidget(actions_widget)
-
-        # Accessibility
-        self.setAccessibleName(f"{session.title}. {type_name}. {status_text}")
+        self.delete_btn = QPushButton("Delete")
+        self.delete_btn.setProperty("class", "card-delete")
+        self.delete_btn.setMinimumHeight(44)
+        self.delete_btn.clicked.connect(self._on_delete_clicked)
+        actions.addWidget(self.delete_btn)
+
+        layout.addLayout(actions)
+
         self.setAccessibleDescription("Use Open button to open this consultation")
 
+    def update_from(self, session: SessionDisplayRow):
+        """Show another session in this card without rebuilding it."""
+        self.row = session
+        self.session_id = session.id
+        self.session_title = session.title or "Untitled Consultation"
+        self.original_title = self.session_title
+        self.title_input.setText(self.session_title)
+
+        type_name = _TYPE_INFO.get(session.template_type, _UNKNOWN_TYPE_INFO)[0]
+        self.type_label.setText(type_name)
+
+        status_text = "Complete" if session.completed else f"In Progress - {session.current_phase}"
+        self.status_label.setText(status_text)
+
+        if session.updated_at:
+            modified = _format_card_timestamp(session.updated_at)
+        else:
+            modified = "Unknown"
+        self.modified_label.setText(f"Last modified: {modified}")
+
+        # Accessibility; named like the visible title, so untitled sessions
+        # are not announced as "None"
+        title = self.session_title
+        self.open_btn.setAccessibleName(f"Open {title}")
+        self.notes_btn.setAccessibleName(f"Notes for {title}")
+        self.delete_btn.setAccessibleName(f"Delete {title}")
+        self.setAccessibleName(f"{title}. {type_name}. {status_text}")
+
+    @pyqtSlot()
+    def _on_open_clicked(self):
+        """Request that this card's item be opened."""
+        self.open_requested.emit(self.session_id)
+
+    @pyqtSlot()
+    def _on_notes_clicked(self):
+        """Request the notes dialog for this card's item."""
+        self.notes_requested.emit(self.session_id, self.session_title)
+
+    @pyqtSlot()
+    def _on_delete_clicked(self):
+        """Request deletion of this card's item."""
+        self.delete_requested.emit(self.session_id)
+
+    @pyqtSlot()
     def on_title_changed(self):
         """Handle title edit completion."""
         new_title = self.title_input.text().strip()
-        if new_title and new_title != self.original_title:
+        if not new_title:
+            # A cleared title is not saved; show the current one again
+            self.title_input.setText(self.original_title)
+        elif new_title != self.original_title:
             self.title_changed.emit(self.session_id, new_title)
             self.original_title = new_title
 
@@ -1468,11 +1875,7 @@ class NewSessionDialog(QDialog):
 
     def setup_ui(self):
         """Set up the dialog UI."""
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {COLORS['dark_card']};
-            }}
-        """)
+        self.setStyleSheet(_NEW_SESSION_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(16)
@@ -1480,39 +1883,42 @@ class NewSessionDialog(QDialog):
 
         # Title
         title = QLabel("Start New Consultation")
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(shared_font(20, bold=True))
         layout.addWidget(title)
 
-        # Session name
-        name_label = QLabel("Session Name")
-        layout.addWidget(name_label)
+        # Fields; labels sit above their inputs and become their buddies
+        form = QFormLayout()
+        form.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
+        form.setVerticalSpacing(16)
+        form.setContentsMargins(0, 0, 0, 0)
 
+        # Session name
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter a name for this consultation")
         self.name_input.setAccessibleName("Session name input")
         self.name_input.setMinimumHeight(48)
-        name_label.setBuddy(self.name_input)
-        layout.addWidget(self.name_input)
+        form.addRow("Session Name", self.name_input)
 
         # Consultation type
-        type_label = QLabel("Consultation Type")
-        layout.addWidget(type_label)
-
         self.type_combo = QComboBox()
         self.type_combo.setAccessibleName("Select consultation type")
         self.type_combo.setMinimumHeight(48)
-        type_label.setBuddy(self.type_combo)
 
-        for key, value in CONSULTATION_TYPES.items():
-            self.type_combo.addItem(value["name"], key)
+        self.type_combo.blockSignals(True)
+        self.type_combo.addItems([name for name, _ in _CONSULTATION_ITEMS])
+        for index, (_, key) in enumerate(_CONSULTATION_ITEMS):
+            self.type_combo.setItemData(index, key)
+        self.type_combo.blockSignals(False)
 
-        layout.addWidget(self.type_combo)
+        form.addRow("Consultation Type", self.type_combo)
 
         # Type description
         self.type_description = QLabel()
         self.type_description.setWordWrap(True)
-        self.type_description.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 14px;")
-        layout.addWidget(self.type_description)
+        self.type_description.setStyleSheet(_TYPE_DESCRIPTION_QSS)
+        form.addRow(self.type_description)
+
+        layout.addLayout(form)
 
         self.type_combo.currentIndexChanged.connect(self.update_type_description)
         self.update_type_description()
@@ -1539,10 +1945,7 @@ class NewSessionDialog(QDialog):
         """Update the description based on selected type."""
         type_key = self.type_combo.currentData()
         if type_key:
-            prompt = CONSULTATION_TYPES.get(type_key, {}).get("prompt", "")
-            # Get first sentence
-            desc = prompt.split(".")[0] + "." if prompt else ""
-            self.type_description.setText(desc)
+            self.type_description.setText(_TYPE_INFO.get(type_key, _UNKNOWN_TYPE_INFO)[1])
 
     def get_values(self) -> tuple[str, str]:
         """Get the entered values."""
@@ -1551,6 +1954,15 @@ class NewSessionDialog(QDialog):
         return name, type_key
 
 
+# Number of sessions whose notes the dashboard keeps in memory
+NOTES_CACHE_SIZE = 128
+# Window for batching note saves into one transaction, and the batch cap
+NOTE_FLUSH_MS = 50
+NOTE_FLUSH_MAX = 32
+# Quiet period before a renamed session's title is written
+TITLE_SAVE_DELAY_MS = 300
+
+
 class DashboardWidget(QWidget):
     """Main dashboard widget."""
 
@@ -1564,6 +1976,44 @@ class DashboardWidget(QWidget):
         self.db = db_manager
         self.auth = auth_manager
         self.ai = ai_manager
+        self._card_pool: list[SessionCard] = []
+        self._sessions_status_label = None
+        self._sessions_loader = None
+        self._sessions_generation = 0
+        self._shown_sessions: list[SessionDisplayRow] = []
+        self._overview_card_pool: list[OverviewCard] = []
+        self._loaded_overviews: list[OverviewDisplayRow] = []
+        self._overviews_generation = 0
+        self._overviews_empty_label = None
+        self._tutorial_dialog = None
+        self._new_session_dialog = None
+        self._overview_dialog = None
+        self._db_tasks: set[DbTask] = set()
+        # session_id -> notes, least recently used first
+        self._notes_cache: "OrderedDict[int, list]" = OrderedDict()
+        # Bumped on every note save so fetches that started earlier are not cached
+        self._notes_epoch = 0
+        # Notes saved within NOTE_FLUSH_MS of each other are written together
+        self._pending_notes: list[tuple[int, str, str]] = []
+        self._note_flush_timer = QTimer(self)
+        self._note_flush_timer.setSingleShot(True)
+        self._note_flush_timer.setInterval(NOTE_FLUSH_MS)
+        self._note_flush_timer.timeout.connect(self._flush_pending_notes)
+        # Title edits are written TITLE_SAVE_DELAY_MS after the last one, per session
+        self._pending_titles: dict[int, str] = {}
+        # Titles handed to the thread pool whose write has not reported back;
+        # laid over loaded rows so a concurrent load cannot show the old title
+        self._writing_titles: dict[int, str] = {}
+        self._title_timers: dict[int, QTimer] = {}
+        self._toast = None
+        self._open_notes_dialogs: dict[int, NotesDialog] = {}
+        self._confirm_delete_box = None
+        self._pending_delete_id = None
+        # Set while a reload is owed but the dashboard is hidden; the first
+        # load also waits until it is shown
+        self._needs_reload = True
+        # Signed-in user, looked up once per reload
+        self._user = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -1576,25 +2026,7 @@ class DashboardWidget(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {COLORS['dark_bg']};
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['dark_input']};
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['primary']};
-            }}
-        """)
+        scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
         scroll_content = QWidget()
         layout = QVBoxLayout(scroll_content)
@@ -1606,15 +2038,15 @@ class DashboardWidget(QWidget):
 
         title_section = QVBoxLayout()
         title = QLabel("Dashboard")
-        title.setFont(QFont("Arial", 28, QFont.Weight.Bold))
+        title.setFont(shared_font(28, bold=True))
         title.setAccessibleName("Dashboard heading")
         title_section.addWidget(title)
 
-        user = self.auth.get_current_user()
-        if user:
-            welcome = QLabel(f"Welcome back, {user.email or 'Local User'}")
-            welcome.setStyleSheet(f"color: {COLORS['text_muted']};")
-            title_section.addWidget(welcome)
+        # Filled in for the signed-in user on each reload
+        self.welcome_label = QLabel()
+        self.welcome_label.setProperty("class", "muted")
+        self.welcome_label.hide()
+        title_section.addWidget(self.welcome_label)
 
         header.addLayout(title_section)
         header.addStretch()
@@ -1646,7 +2078,7 @@ class DashboardWidget(QWidget):
         sessions_header = QHBoxLayout()
 
         sessions_label = QLabel("Recent Consultations")
-        sessions_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        sessions_label.setFont(shared_font(18, bold=True))
         sessions_header.addWidget(sessions_label)
 
         sessions_header.addStretch()
@@ -1664,7 +2096,7 @@ class DashboardWidget(QWidget):
         # Section divider
         sessions_divider = QFrame()
         sessions_divider.setFrameShape(QFrame.Shape.HLine)
-        sessions_divider.setStyleSheet(f"background-color: {COLORS.get('dark_border', '#1c2a4a')}; max-height: 1px;")
+        sessions_divider.setProperty("class", "divider")
         layout.addWidget(sessions_divider)
 
         # Sessions scroll area
@@ -1675,12 +2107,7 @@ class DashboardWidget(QWidget):
         self.sessions_area.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
         self.sessions_container = QWidget()
-        self.sessions_layout = QGridLayout(self.sessions_container)
-        self.sessions_layout.setSpacing(20)
-        # Set columns to stretch equally
-        self.sessions_layout.setColumnStretch(0, 1)
-        self.sessions_layout.setColumnStretch(1, 1)
-        self.sessions_layout.setColumnStretch(2, 1)
+        self.sessions_layout = self._make_card_grid(self.sessions_container)
 
         self.sessions_area.setWidget(self.sessions_container)
         layout.addWidget(self.sessions_area)
@@ -1691,7 +2118,7 @@ class DashboardWidget(QWidget):
         overviews_header = QHBoxLayout()
 
         overviews_label = QLabel("Personal Consult Overviews")
-        overviews_label.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        overviews_label.setFont(shared_font(18, bold=True))
         overviews_header.addWidget(overviews_label)
 
         overviews_header.addStretch()
@@ -1709,7 +2136,7 @@ class DashboardWidget(QWidget):
         # Section divider
         overviews_divider = QFrame()
         overviews_divider.setFrameShape(QFrame.Shape.HLine)
-        overviews_divider.setStyleSheet(f"background-color: {COLORS.get('dark_border', '#1c2a4a')}; max-height: 1px;")
+        overviews_divider.setProperty("class", "divider")
         layout.addWidget(overviews_divider)
 
         # Overviews scroll area
@@ -1720,11 +2147,7 @@ class DashboardWidget(QWidget):
         self.overviews_area.setFocusPolicy(Qt.FocusPolicy.TabFocus)
 
         self.overviews_container = QWidget()
-        self.overviews_layout = QGridLayout(self.overviews_container)
-        self.overviews_layout.setSpacing(20)
-        self.overviews_layout.setColumnStretch(0, 1)
-        self.overviews_layout.setColumnStretch(1, 1)
-        self.overviews_layout.setColumnStretch(2, 1)
+        self.overviews_layout = self._make_card_grid(self.overviews_container)
 
         self.overviews_area.setWidget(self.overviews_container)
         layout.addWidget(self.overviews_area)
@@ -1733,99 +2156,366 @@ class DashboardWidget(QWidget):
         scroll.setWidget(scroll_content)
         main_layout.addWidget(scroll)
 
-        self.load_sessions()
-        self.load_overviews()
+    def _make_card_grid(self, container: QWidget) -> QGridLayout:
+        """Grid of equal, pre-sized card columns, so column widths need no solving."""
+        grid = QGridLayout(container)
+        grid.setHorizontalSpacing(GRID_SPACING)
+        grid.setVerticalSpacing(GRID_SPACING)
+        for column in range(GRID_COLUMNS):
+            grid.setColumnStretch(column, 1)
+            grid.setColumnMinimumWidth(column, CARD_MIN_WIDTH)
+        return grid
 
     def load_sessions(self):
-        """Load and display user sessions."""
-        # Clear existing cards
-        while self.sessions_layout.count():
-            item = self.sessions_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        user = self.auth.get_current_user()
+        """Load user sessions on the thread pool, then display them."""
+        # Pending renames must be in the DB before it is read back
+        self.flush_pending_titles()
+        user = self._user
+        self._sessions_generation += 1
         if not user:
+            self._show_sessions(None, [])
             return
 
-        sessions = self.db.get_user_sessions(user.id)
-
-        if not sessions:
-            empty_label = QLabel("No consultations yet. Start one above!")
-            empty_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 16px;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.sessions_layout.addWidget(empty_label, 0, 0)
+        if not self._card_pool:
+            self._set_sessions_status("Loading consultations...")
+        loader = SessionsLoader(self.db, user.id, self._sessions_generation)
+        loader.signals.done.connect(self._on_sessions_loaded)
+        self._sessions_loader = loader
+        QThreadPool.globalInstance().start(loader)
+
+    @pyqtSlot(int, list)
+    def _on_sessions_loaded(self, generation: int, sessions: list):
+        """Show sessions fetched by SessionsLoader, ignoring superseded loads."""
+        if generation != self._sessions_generation:
             return
+        self._sessions_loader = None
+        if self._writing_titles:
+            sessions = [
+                session._replace(title=self._writing_titles[session.id])
+                if session.id in self._writing_titles else session
+                for session in sessions
+            ]
+        self._show_sessions(self._user, sessions)
+        self._prefetch_notes([session.id for session in sessions])
+
+    def _prefetch_notes(self, session_ids: list):
+        """Load the notes of the shown sessions that are not cached yet, in one background query."""
+        # A read racing queued notes would be dropped by the epoch check anyway
+        missing = [session_id for session_id in session_ids if session_id not in self._notes_cache]
+        if not missing or self._pending_notes:
+            return
+        self._run_db(
+            partial(self._on_notes_prefetched, self._notes_epoch),
+            self.db.get_notes_for_sessions, missing
+        )
 
-        # Display in grid (3 columns)
-        for i, session in enumerate(sessions[:12]):  # Show last 12
-            row = i // 3
-            col = i % 3
-
-            card = SessionCard(session)
-            card.open_requested.connect(self.open_session.emit)
-            card.delete_requested.connect(self.confirm_delete_session)
-            card.title_changed.connect(self.save_session_title)
-            card.notes_requested.connect(self.show_notes_dialog)
-
-            self.sessions_layout.addWidget(card, row, col)
+    def _on_notes_prefetched(self, epoch: int, notes_by_session):
+        """Fill the notes cache from a prefetch, unless a note was saved meanwhile."""
+        if not notes_by_session or epoch != self._notes_epoch:
+            return
+        for session_id, notes in notes_by_session.items():
+            if session_id not in self._notes_cache:
+                self._cache_notes(session_id, notes)
+
+    def _set_sessions_status(self, text: str = None):
+        """Show a message in place of the session cards, or hide it."""
+        if text is None:
+            if self._sessions_status_label is not None:
+                self._sessions_status_label.setVisible(False)
+            return
+        if self._sessions_status_label is None:
+            self._sessions_status_label = QLabel()
+            self._sessions_status_label.setProperty("class", "muted")
+            self._sessions_status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.sessions_layout.addWidget(self._sessions_status_label, 0, 0)
+        self._sessions_status_label.setText(text)
+        self._sessions_status_label.setVisible(True)
+
+    def _show_sessions(self, user, sessions: list):
+        """Fill the sessions grid from display rows."""
+        self._shown_sessions = list(sessions)
+        # Suspend painting and the grid layout so the batch is laid out once
+        self.sessions_container.setUpdatesEnabled(False)
+        self.sessions_layout.setEnabled(False)
+        try:
+            # Reuse the cards from the previous load; only cards for sessions
+            # beyond the pool are created, and spare ones are hidden
+            for i, session in enumerate(sessions):
+                if i < len(self._card_pool):
+                    card = self._card_pool[i]
+                    # Rows are tuples, so an unchanged session leaves its card alone
+                    if card.row != session:
+                        card.update_from(session)
+                else:
+                    card = SessionCard(session)
+                    card.open_requested.connect(self.open_session.emit)
+                    card.delete_requested.connect(self.confirm_delete_session)
+                    card.title_changed.connect(self.save_session_title)
+                    card.notes_requested.connect(self.show_notes_dialog)
+                    self._card_pool.append(card)
+                    # Place in the grid, filling each row left to right
+                    self.sessions_layout.addWidget(card, *divmod(i, GRID_COLUMNS))
+                card.setVisible(True)
+
+            for card in self._card_pool[len(sessions):]:
+                card.setVisible(False)
+
+            if user and not sessions:
+                self._set_sessions_status("No consultations yet. Start one above!")
+            else:
+                self._set_sessions_status(None)
+        finally:
+            self.sessions_layout.setEnabled(True)
+            self.sessions_container.setUpdatesEnabled(True)
+        self.sessions_layout.activate()
 
     def show_new_session_dialog(self):
-        """Show dialog to create new session."""
-        dialog = NewSessionDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            title, type_key = dialog.get_values()
-            self.new_session.emit(title, type_key)
+        """Show dialog to create new session, building it on first use."""
+        if self._new_session_dialog is None:
+            self._new_session_dialog = NewSessionDialog(self)
+            self._new_session_dialog.accepted.connect(self._on_new_session_accepted)
+        dialog = self._new_session_dialog
+        dialog.name_input.clear()
+        dialog.type_combo.setCurrentIndex(0)
+        dialog.name_input.setFocus()
+        dialog.open()
+
+    def _on_new_session_accepted(self):
+        """Start the session described by the new-session dialog."""
+        title, type_key = self._new_session_dialog.get_values()
+        self.new_session.emit(title, type_key)
 
     def confirm_delete_session(self, session_id: int):
-        """Confirm and delete a session."""
-        reply = QMessageBox.question(
-            self,
-            "Delete Consultation",
-            "Are you sure you want to delete this consultation? This action cannot be undone.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-
-        if reply == QMessageBox.StandardButton.Yes:
-            self.db.delete_session(session_id)
+        """Ask to delete a session without blocking the event loop."""
+        if self._confirm_delete_box is None:
+            self._confirm_delete_box = QMessageBox(
+                QMessageBox.Icon.Question,
+                "Delete Consultation",
+                "Are you sure you want to delete this consultation? This action cannot be undone.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                self
+            )
+            self._confirm_delete_box.buttonClicked.connect(self._on_delete_session_answered)
+        self._pending_delete_id = session_id
+        # No is the safe default every time the box is shown
+        self._confirm_delete_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._confirm_delete_box.open()
+
+    def _on_delete_session_answered(self, button):
+        """Delete the pending session if the confirmation was answered Yes."""
+        session_id, self._pending_delete_id = self._pending_delete_id, None
+        if session_id is None or self._confirm_delete_box.standardButton(button) != QMessageBox.StandardButton.Yes:
+            return
+        self._notes_cache.pop(session_id, None)
+        self._pending_titles.pop(session_id, None)
+        self._writing_titles.pop(session_id, None)
+        # Drop the card straight away; reload if the delete fails, or to
+        # backfill the grid when older sessions were cut off by the limit
+        backfill = len(self._shown_sessions) >= SessionsLoader.LIMIT
+        remaining = [session for session in self._shown_sessions if session.id != session_id]
+        self._show_sessions(self._user, remaining)
+        self._run_db(partial(self._on_session_deleted, backfill), self.db.delete_session, session_id)
+
+    def _on_session_deleted(self, backfill: bool, deleted):
+        """Resync the grid with the DB after a failed or limit-hitting delete."""
+        if backfill or not deleted:
             self.load_sessions()
 
     def save_session_title(self, session_id: int, new_title: str):
-        """Save updated session title."""
-        self.db.update_session(session_id, title=new_title)
+        """Save an updated session title once edits to it have settled."""
+        self._pending_titles[session_id] = new_title
+        self._patch_session_title(session_id, new_title)
+        timer = self._title_timers.get(session_id)
+        if timer is None:
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(TITLE_SAVE_DELAY_MS)
+            timer.timeout.connect(partial(self._write_session_title, session_id))
+            self._title_timers[session_id] = timer
+        timer.start()
+
+    def _patch_session_title(self, session_id: int, new_title: str):
+        """Update the shown row and card for a renamed session in place."""
+        for i, session in enumerate(self._shown_sessions):
+            if session.id == session_id:
+                self._shown_sessions[i] = session._replace(title=new_title)
+                self._card_pool[i].update_from(self._shown_sessions[i])
+                return
+
+    def _write_session_title(self, session_id: int):
+        """Write a session's settled title in the background."""
+        new_title = self._pending_titles.pop(session_id, None)
+        if new_title is not None:
+            self._writing_titles[session_id] = new_title
+            self._run_db(
+                partial(self._on_session_title_written, session_id, new_title),
+                self.db.update_session, session_id, title=new_title
+            )
+
+    def _on_session_title_written(self, session_id: int, new_title: str, _result):
+        """Stop overlaying a title once its write has finished, unless a newer one is in flight."""
+        if self._writing_titles.get(session_id) == new_title:
+            del self._writing_titles[session_id]
+
+    def flush_pending_titles(self):
+        """Write every pending title edit now, on the calling thread."""
+        for timer in self._title_timers.values():
+            timer.stop()
+        pending, self._pending_titles = self._pending_titles, {}
+        for session_id, new_title in pending.items():
+            self.db.update_session(session_id, title=new_title)
+
+    def shutdown(self):
+        """Write pending title edits and notes and stop background work before the application exits."""
+        if self._overview_dialog is not None:
+            self._overview_dialog.shutdown()
+        self.flush_pending_titles()
+        self._note_flush_timer.stop()
+        if self._pending_notes:
+            batch, self._pending_notes = self._pending_notes, []
+            self.db.add_session_notes_bulk(batch)
+
+    def _run_db(self, on_done, fn, *args, **kwargs):
+        """Run a DatabaseManager call on the thread pool; on_done(result) runs on the UI thread."""
+        task = DbTask(fn, *args, **kwargs)
+        # Keep the task (and its signals object) alive until it reports back
+        self._db_tasks.add(task)
+        task.signals.finished.connect(partial(self._on_db_task_finished, task, on_done))
+        QThreadPool.globalInstance().start(task)
+
+    def _on_db_task_finished(self, task: DbTask, on_done, result):
+        """Release a finished DbTask and hand its result to the caller's callback."""
+        self._db_tasks.discard(task)
+        if on_done is not None:
+            on_done(result)
 
     def refresh_styles(self):
         """Re-apply styles after accessibility settings change, then reload cards."""
-        self.load_sessions()
-        self.load_overviews()
+        self._reload_when_visible()
 
     def refresh(self):
         """Refresh the dashboard."""
+        self._notes_cache.clear()
+        self._reload_when_visible()
+
+    def _reload_when_visible(self):
+        """Reload both grids now if the dashboard is showing, otherwise when it is next shown."""
+        if not self.isVisible():
+            self._needs_reload = True
+            return
+        self._needs_reload = False
+        self._user = self.auth.get_current_user()
+        if self._user:
+            self.welcome_label.setText(f"Welcome back, {self._user.email or 'Local User'}")
+        self.welcome_label.setVisible(self._user is not None)
         self.load_sessions()
         self.load_overviews()
 
+    def showEvent(self, event):
+        """Run a reload that was deferred while the dashboard was hidden."""
+        super().showEvent(event)
+        if self._needs_reload:
+            self._reload_when_visible()
+
     def show_tutorial(self):
-        """Show the dashboard tutorial."""
-        dialog = TutorialDialog(self)
-        dialog.exec()
+        """Show the dashboard tutorial, building the dialog on first use."""
+        if self._tutorial_dialog is None:
+            self._tutorial_dialog = TutorialDialog(self)
+        self._tutorial_dialog.restart()
+        self._tutorial_dialog.open()
 
     def show_notes_dialog(self, session_id: int, session_title: str):
-        """Show the notes dialog for a session."""
-        notes = self.db.get_session_notes(session_id)
+        """Show the notes dialog for a session, fetching its notes in the background on a cache miss."""
+        notes = self._cached_notes(session_id)
+        if notes is not None:
+            self._open_notes_dialog(session_id, session_title, notes)
+            return
+        self._run_db(
+            partial(self._on_notes_fetched, session_id, session_title, self._notes_epoch),
+            self.db.get_session_notes, session_id
+        )
+
+    def _cached_notes(self, session_id: int):
+        """Return a session's cached notes (marking them recently used), or None."""
+        notes = self._notes_cache.get(session_id)
+        if notes is not None:
+            self._notes_cache.move_to_end(session_id)
+        return notes
+
+    def _cache_notes(self, session_id: int, notes: list):
+        """Store a session's notes, evicting the least recently used entry past the cap."""
+        self._notes_cache[session_id] = notes
+        self._notes_cache.move_to_end(session_id)
+        if len(self._notes_cache) > NOTES_CACHE_SIZE:
+            self._notes_cache.popitem(last=False)
+
+    def _on_notes_fetched(self, session_id: int, session_title: str, epoch: int, notes):
+        """Cache freshly loaded notes and show them."""
+        if notes is None:
+            notes = []
+        elif epoch == self._notes_epoch:
+            self._cache_notes(session_id, notes)
+        self._open_notes_dialog(session_id, session_title, notes)
+
+    def _open_notes_dialog(self, session_id: int, session_title: str, notes: list):
+        """Show the notes dialog for a session once its notes are loaded."""
         dialog = NotesDialog(session_id, session_title, notes, self)
         dialog.note_added.connect(self.save_note)
-        dialog.exec()
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        # Keep a reference while the dialog is up; open() returns immediately
+        self._open_notes_dialogs[session_id] = dialog
+        dialog.finished.connect(partial(self._on_notes_dialog_finished, session_id))
+        dialog.open()
+
+    def _on_notes_dialog_finished(self, session_id: int, _result: int):
+        """Forget a closed notes dialog."""
+        self._open_notes_dialogs.pop(session_id, None)
 
     def save_note(self, session_id: int, note_content: str):
-        """Save a note to a session."""
-        self.db.add_session_note(session_id, note_content)
-        QMessageBox.information(
-            self,
-            "Note Saved",
-            "Your note has been saved with a timestamp."
+        """Queue a note for the next batched write."""
+        self._notes_epoch += 1
+        self._pending_notes.append((session_id, note_content, datetime.utcnow().isoformat()))
+        if len(self._pending_notes) >= NOTE_FLUSH_MAX:
+            self._flush_pending_notes()
+        elif not self._note_flush_timer.isActive():
+            self._note_flush_timer.start()
+
+    def _flush_pending_notes(self):
+        """Write all queued notes in one background transaction."""
+        self._note_flush_timer.stop()
+        if not self._pending_notes:
+            return
+        batch, self._pending_notes = self._pending_notes, []
+        # Reads that overlap the write may or may not see the new notes
+        self._notes_epoch += 1
+        self._run_db(partial(self._on_notes_saved, batch), self.db.add_session_notes_bulk, batch)
+
+    def _on_notes_saved(self, batch: list, added):
+        """Write saved notes through to the notes cache and confirm them."""
+        self._notes_epoch += 1
+        added = added or {}
+        for session_id, new_notes in added.items():
+            notes = self._notes_cache.get(session_id)
+            if notes is not None:
+                notes.extend(new_notes)
+
+        failed = {session_id for session_id, _, _ in batch if session_id not in added}
+        for session_id in failed:
+            self._notes_cache.pop(session_id, None)
+        if failed:
+            QMessageBox.warning(self, "Note Not Saved", "Your note could not be saved. Please try again.")
+            return
+        self.show_toast(
+            "Note saved with a timestamp." if len(batch) == 1
+            else f"{len(batch)} notes saved with timestamps."
         )
 
+    def show_toast(self, text: str):
+        """Briefly show a non-blocking confirmation at the bottom of the dashboard."""
+        if self._toast is None:
+            self._toast = Toast(self)
+        self._toast.show_message(text)
+
     def show_consult_overview(self):
         """Show the AI-generated consultation overview."""
         if not self.ai:
@@ -1836,44 +2526,75 @@ class DashboardWidget(QWidget):
             )
             return
 
-        dialog = ConsultOverviewDialog(self.db, self.auth, self.ai, self)
-        dialog.exec()
-        # Refresh overviews list after dialog closes
+        # Built once; its worker and gathered-conversation cache carry over
+        if self._overview_dialog is None:
+            self._overview_dialog = ConsultOverviewDialog(self.db, self.auth, self.ai, self)
+            self._overview_dialog.finished.connect(self._on_overview_dialog_finished)
+        self._overview_dialog.reset()
+        self._overview_dialog.open()
+
+    def _on_overview_dialog_finished(self, _result: int):
+        """Refresh the overviews list after the overview dialog closes."""
         self.load_overviews()
 
     def load_overviews(self):
-        """Load and display user overviews."""
-        # Clear existing cards
-        while self.overviews_layout.count():
-            item = self.overviews_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        user = self.auth.get_current_user()
+        """Load user overviews on the thread pool, then display them."""
+        user = self._user
+        self._overviews_generation += 1
         if not user:
+            self._show_overviews(None, [])
             return
+        self._run_db(
+            partial(self._on_overviews_loaded, self._overviews_generation),
+            self.db.get_user_overview_display_rows, user.id, limit=9
+        )
 
-        overviews = self.db.get_user_overviews(user.id)
-
-        if not overviews:
-            empty_label = QLabel("No overviews yet. Click 'Consult Overview' to generate one!")
-            empty_label.setStyleSheet(f"color: {COLORS['text_muted']}; font-size: 14px;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.overviews_layout.addWidget(empty_label, 0, 0)
+    def _on_overviews_loaded(self, generation: int, overviews):
+        """Show loaded overviews, ignoring superseded loads."""
+        if generation != self._overviews_generation:
             return
-
-        # Display in grid (3 columns)
-        for i, overview in enumerate(overviews[:9]):  # Show last 9
-            row = i // 3
-            col = i % 3
-
-            card = OverviewCard(overview)
-            card.open_requested.connect(self.open_overview)
-            card.delete_requested.connect(self.confirm_delete_overview)
-            card.notes_requested.connect(self.show_overview_notes_dialog)
-            card.title_changed.connect(self.save_overview_title)
-
-            self.overviews_layout.addWidget(card, row, col)
+        self._show_overviews(self._user, overviews or [])
+
+    def _show_overviews(self, user, overviews: list):
+        """Fill the overviews grid from loaded overviews."""
+        self._loaded_overviews = list(overviews)
+        # Suspend painting and the grid layout so the batch is laid out once
+        self.overviews_container.setUpdatesEnabled(False)
+        self.overviews_layout.setEnabled(False)
+        try:
+            # Cards keep their grid cell across loads; only cards beyond the
+            # pool are created, and spare ones are hidden
+            for i, overview in enumerate(overviews):
+                if i < len(self._overview_card_pool):
+                    card = self._overview_card_pool[i]
+                    if card.row != overview:
+                        card.update_from(overview)
+                else:
+                    card = OverviewCard(overview)
+                    card.open_requested.connect(self.open_overview)
+                    card.delete_requested.connect(self.confirm_delete_overview)
+                    card.notes_requested.connect(self.show_overview_notes_dialog)
+                    card.title_changed.connect(self.save_overview_title)
+                    self._overview_card_pool.append(card)
+                    # Place in the grid, filling each row left to right
+                    self.overviews_layout.addWidget(card, *divmod(i, GRID_COLUMNS))
+                card.setVisible(True)
+
+            for card in self._overview_card_pool[len(overviews):]:
+                card.setVisible(False)
+
+            show_empty = bool(user) and not overviews
+            if show_empty and self._overviews_empty_label is None:
+                self._overviews_empty_label = QLabel("No overviews yet. Click 'Consult Overview' to generate one!")
+                self._overviews_empty_label.setStyleSheet(_TYPE_DESCRIPTION_QSS)
+                self._overviews_empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.overviews_layout.addWidget(self._overviews_empty_label, 0, 0)
+            if self._overviews_empty_label is not None:
+                self._overviews_empty_label.setVisible(show_empty)
+        finally:
+            self.overviews_layout.setEnabled(True)
+            self.overviews_container.setUpdatesEnabled(True)
+        self.overviews_layout.activate()
 
     def open_overview(self, overview_id: int):
         """Open a saved overview."""
@@ -1893,7 +2614,14 @@ class DashboardWidget(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.db.delete_overview(overview_id)
+            # Drop the card straight away; reload only if the delete fails
+            remaining = [overview for overview in self._loaded_overviews if overview.id != overview_id]
+            self._show_overviews(self._user, remaining)
+            self._run_db(self._on_overview_deleted, self.db.delete_overview, overview_id)
+
+    def _on_overview_deleted(self, deleted):
+        """Resync the overviews grid with the DB if a delete did not go through."""
+        if not deleted:
             self.load_overviews()
 
     def show_overview_notes_dialog(self, overview_id: int, overview_title: str):
@@ -1906,12 +2634,13 @@ class DashboardWidget(QWidget):
     def save_overview_note(self, overview_id: int, note_content: str):
         """Save a note to an overview."""
         self.db.add_overview_note(overview_id, note_content)
-        QMessageBox.information(
-            self,
-            "Note Saved",
-            "Your note has been saved with a timestamp."
-        )
+        self.show_toast("Note saved with a timestamp.")
 
     def save_overview_title(self, overview_id: int, new_title: str):
         """Save updated overview title."""
         self.db.update_overview_title(overview_id, new_title)
+        # Keep the loaded copy in step so a local re-render shows the new title
+        for i, overview in enumerate(self._loaded_overviews):
+            if overview.id == overview_id:
+                self._loaded_overviews[i] = overview._replace(title=new_title)
+                break
@@ -14,6 +14,7 @@ from PyQt6.QtGui import QFont, QPixmap
 
 from config.settings import COLORS
 from core.auth import AuthManager
+from ui.styles import SCROLL_AREA_STYLE
 
 # Security question options
 SECURITY_QUESTIONS = [
@@ -392,25 +393,7 @@ class LoginWidget(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {COLORS['dark_bg']};
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['dark_input']};
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['primary']};
-            }}
-        """)
+        scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
@@ -666,25 +649,7 @@ class LoginWidget(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.Shape.NoFrame)
-        scroll.setStyleSheet(f"""
-            QScrollArea {{
-                border: none;
-                background-color: transparent;
-            }}
-            QScrollBar:vertical {{
-                background-color: {COLORS['dark_bg']};
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['dark_input']};
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['primary']};
-            }}
-        """)
+        scroll.setStyleSheet(SCROLL_AREA_STYLE)
 
         scroll_content = QWidget()
         layout = QVBoxLayout(scroll_content)
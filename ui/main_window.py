@@ -274,7 +274,7 @@ class MainWindow(QMainWindow):
         self.chat_page.load_session(session_id)
         self.stack.setCurrentWidget(self.chat_page)
         # Focus the message input
-        QTimer.singleShot(100, lambda: self.chat_page.message_input.setFocus())
+        QTimer.singleShot(100, self.chat_page.message_input.setFocus)
 
     def create_session(self, title: str, template_type: str):
         """Create and open a new session (saved to database)."""
@@ -285,7 +285,7 @@ class MainWindow(QMainWindow):
         session = self.conversation.start_new_session(user.id, title, template_type)
         self.chat_page.load_session(session.id)
         self.stack.setCurrentWidget(self.chat_page)
-        QTimer.singleShot(100, lambda: self.chat_page.message_input.setFocus())
+        QTimer.singleShot(100, self.chat_page.message_input.setFocus)
 
     def on_session_saved(self):
         """Handle when a temporary session is saved."""
@@ -321,7 +321,7 @@ class MainWindow(QMainWindow):
             self.a11y_manager.load_from_dict({})
             self.stack.setCurrentWidget(self.login_page)
             # Focus email input on login page
-            QTimer.singleShot(100, lambda: self.login_page.login_email.setFocus())
+            QTimer.singleShot(100, self.login_page.login_email.setFocus)
 
     def resizeEvent(self, event):
         """Handle window resize."""
@@ -342,6 +342,8 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close."""
+        self.chat_page.shutdown()
+        self.dashboard_page.shutdown()
         if self._cursor_trail is not None:
             self._cursor_trail.stop()
         # Clean up cursor override to restore system default on exit
@@ -1,5 +1,7 @@
 """Global styles and stylesheets for the application."""
 
+from PyQt6.QtGui import QFont
+
 from config.settings import COLORS
 
 
@@ -216,6 +218,113 @@ QFrame[class="card"]:hover {{
     background-color: {c.get('dark_hover', '#1a2d50')};
 }}
 
+/* Dashboard session and overview cards. The frame rule also covers the
+   card's labels, which are QFrames themselves. */
+QFrame[class="session-card"], QFrame[class="session-card"] QLabel,
+QFrame[class="overview-card"], QFrame[class="overview-card"] QLabel {{
+    background-color: {c['dark_card']};
+    border: 1px solid {c.get('dark_border', '#1c2a4a')};
+    border-radius: 12px;
+    padding: 20px;
+}}
+
+QFrame[class="overview-card"], QFrame[class="overview-card"] QLabel {{
+    border-left: 4px solid {c['secondary']};
+}}
+
+QFrame[class="session-card"]:hover, QFrame[class="session-card"] QLabel:hover,
+QFrame[class="overview-card"]:hover, QFrame[class="overview-card"] QLabel:hover {{
+    background-color: {c.get('dark_hover', '#1a2d50')};
+}}
+
+QFrame[class="session-card"] QLineEdit, QFrame[class="overview-card"] QLineEdit {{
+    background-color: {c['dark_input']};
+    color: {c['text']};
+    border: none;
+    border-radius: 6px;
+    padding: 6px 8px;
+}}
+
+QFrame[class="session-card"] QLineEdit:focus, QFrame[class="overview-card"] QLineEdit:focus {{
+    border: 1px solid {c['primary']};
+    padding: 5px 7px;
+}}
+
+QFrame[class="session-card"] QLabel[class="card-badge"],
+QFrame[class="overview-card"] QLabel[class="card-badge"] {{
+    background-color: {c['secondary']};
+    color: {c['text']};
+    padding: 4px 8px;
+    border-radius: 4px;
+    font-size: 11px;
+}}
+
+QFrame[class="session-card"] QLabel[class="card-meta"],
+QFrame[class="overview-card"] QLabel[class="card-meta"] {{
+    color: {c['text_muted']};
+    font-size: 12px;
+}}
+
+QFrame[class="session-card"] QLabel[class="card-caption"],
+QFrame[class="overview-card"] QLabel[class="card-caption"] {{
+    color: {c['text_muted']};
+    font-size: 11px;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-open"],
+QFrame[class="overview-card"] QPushButton[class="card-open"] {{
+    background-color: {c['success']};
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 4px 12px;
+    font-weight: bold;
+    min-height: 36px;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-open"]:hover,
+QFrame[class="overview-card"] QPushButton[class="card-open"]:hover {{
+    background-color: #27ae60;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-notes"],
+QFrame[class="overview-card"] QPushButton[class="card-notes"] {{
+    background-color: {c['primary']};
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 4px 12px;
+    font-weight: bold;
+    min-height: 36px;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-notes"]:hover,
+QFrame[class="overview-card"] QPushButton[class="card-notes"]:hover {{
+    background-color: #5849c4;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-delete"],
+QFrame[class="overview-card"] QPushButton[class="card-delete"] {{
+    background-color: transparent;
+    color: {c['error']};
+    border: 1px solid {c['error']};
+    border-radius: 8px;
+    padding: 4px 8px;
+    min-height: 36px;
+}}
+
+QFrame[class="session-card"] QPushButton[class="card-delete"]:hover,
+QFrame[class="overview-card"] QPushButton[class="card-delete"]:hover {{
+    background-color: {c['error']};
+    color: white;
+}}
+
+/* Section dividers */
+QFrame[class="divider"] {{
+    background-color: {c.get('dark_border', '#1c2a4a')};
+    max-height: 1px;
+}}
+
 /* Progress bar */
 QProgressBar {{
     background-color: {c['dark_input']};
@@ -442,7 +551,41 @@ QFrame {{
 }}
 """
 
+# Slim vertical scrollbar for full-page scroll areas (login, dashboard)
+SCROLL_AREA_STYLE = f"""
+QScrollArea {{
+    border: none;
+    background-color: transparent;
+}}
+QScrollBar:vertical {{
+    background-color: {COLORS['dark_bg']};
+    width: 10px;
+    border-radius: 5px;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {COLORS['dark_input']};
+    border-radius: 5px;
+    min-height: 20px;
+}}
+QScrollBar::handle:vertical:hover {{
+    background-color: {COLORS['primary']};
+}}
+"""
+
 
 def get_focus_style() -> str:
     """Get focus indicator style."""
     return f"outline: 3px solid {COLORS['primary']}; outline-offset: 2px;"
+
+
+# QFont needs a QGuiApplication, so shared fonts are built on first use
+_FONTS = {}
+
+
+def shared_font(size: int, bold: bool = False) -> QFont:
+    """Arial font shared by every widget that uses this size and weight."""
+    font = _FONTS.get((size, bold))
+    if font is None:
+        font = QFont("Arial", size, QFont.Weight.Bold) if bold else QFont("Arial", size)
+        _FONTS[(size, bold)] = font
+    return font